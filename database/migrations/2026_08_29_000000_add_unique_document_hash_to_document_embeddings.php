@@ -0,0 +1,35 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     *
+     * Deduplication previously relied on a SELECT-then-INSERT pair in the
+     * Python ingest path, which races under concurrent writers. A unique
+     * constraint lets inserts use ON CONFLICT (document_hash) DO NOTHING
+     * in a single round-trip.
+     */
+    public function up(): void
+    {
+        Schema::table('document_embeddings', function (Blueprint $table) {
+            $table->dropIndex('doc_embeddings_hash_idx');
+            $table->unique('document_hash', 'doc_embeddings_hash_unique');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('document_embeddings', function (Blueprint $table) {
+            $table->dropUnique('doc_embeddings_hash_unique');
+            $table->index('document_hash', 'doc_embeddings_hash_idx');
+        });
+    }
+};
@@ -125,8 +125,15 @@ class ComplaintAnalysisChain:
         elif any(keyword in complaint_type for keyword in ['water', 'heat', 'traffic']):
             examples = self.few_shot_examples.get_examples_by_risk_level('medium')[:2]
         else:
-            examples = self.few_shot_examples.get_random_examples(3)
-        
+            # Fast path: random examples come back pre-formatted
+            formatted_examples = self.few_shot_examples.get_random_formatted(3)
+
+            logger.debug("Selected few-shot examples",
+                        complaint_type=complaint_type,
+                        example_count=3)
+
+            return formatted_examples
+
         formatted_examples = self.few_shot_examples.format_examples_for_prompt(examples)
         
         logger.debug("Selected few-shot examples",
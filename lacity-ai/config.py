@@ -39,6 +39,7 @@ class LaraCityConfig:
     RAG_CHUNK_OVERLAP: int = int(os.getenv("RAG_CHUNK_OVERLAP", "200"))
     VECTOR_STORE_PATH: str = os.getenv("VECTOR_STORE_PATH", "./data/vector_store")
     EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "50"))
+    EMBEDDING_CONCURRENCY: int = int(os.getenv("EMBEDDING_CONCURRENCY", "8"))
     
     # Database Configuration (PostgreSQL with pgvector)
     DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")
@@ -50,6 +51,8 @@ class LaraCityConfig:
     
     # Complaint Analysis Configuration
     ESCALATION_THRESHOLD: float = float(os.getenv("COMPLAINT_ESCALATE_THRESHOLD", "0.7"))
+    ANALYSIS_BATCH_SIZE: int = int(os.getenv("ANALYSIS_BATCH_SIZE", "10"))
+    BATCH_PROMPT_TOKEN_LIMIT: int = int(os.getenv("BATCH_PROMPT_TOKEN_LIMIT", "6000"))
     
     # Risk Classification Thresholds
     RISK_LEVELS = {
@@ -37,8 +37,8 @@ from config import config
 from chains.analysis_chain import ComplaintAnalysisChain
 from chains.rag_chain import RAGChain
 from chains.chat_chain import ChatChain
-from rag.document_loader import complaint_document_loader
-from rag.vector_store import vector_store_manager
+from rag.document_loader import get_complaint_document_loader
+from rag.vector_store import get_vector_store_manager
 from rag.pgvector_store import PGVectorStoreManager
 from rag.retriever import complaint_retriever
 from models.embeddings import embedding_generator
@@ -259,7 +259,7 @@ class LangChainRunner:
                         complaint_count=len(complaints))
             
             # Convert complaints to documents first
-            documents = complaint_document_loader.load_complaints_as_documents(complaints)
+            documents = get_complaint_document_loader().load_complaints_as_documents(complaints)
             
             # Extract text content
             complaint_texts = [doc.page_content for doc in documents]
@@ -293,7 +293,7 @@ class LangChainRunner:
                     chunk_documents=chunk_documents)
         
         # Create vector store
-        success = vector_store_manager.create_vector_store_from_complaints(
+        success = get_vector_store_manager().create_vector_store_from_complaints(
             complaints, 
             chunk_documents=chunk_documents
         )
@@ -303,12 +303,12 @@ class LangChainRunner:
         
         # Save if path provided
         if store_path:
-            save_success = vector_store_manager.save_vector_store(store_path)
+            save_success = get_vector_store_manager().save_vector_store(store_path)
             if not save_success:
                 logger.warning("Failed to save vector store to specified path")
         
         # Get store statistics
-        stats = vector_store_manager.get_store_stats()
+        stats = get_vector_store_manager().get_store_stats()
         
         return {
             'created': success,
@@ -422,7 +422,7 @@ class LangChainRunner:
         
         # Check vector store
         try:
-            vector_stats = vector_store_manager.get_store_stats()
+            vector_stats = get_vector_store_manager().get_store_stats()
             health_status['components']['vector_store'] = {
                 'status': 'healthy' if vector_stats.get('exists') else 'not_initialized',
                 'stats': vector_stats
@@ -457,15 +457,16 @@ class LangChainRunner:
         # Document loader stats
         try:
             # Create sample to get stats
-            sample_docs = complaint_document_loader.load_complaints_as_documents([])
-            doc_stats = complaint_document_loader.get_document_stats(sample_docs)
+            document_loader = get_complaint_document_loader()
+            sample_docs = document_loader.load_complaints_as_documents([])
+            doc_stats = document_loader.get_document_stats(sample_docs)
             stats['components']['document_loader'] = doc_stats
         except Exception as e:
             stats['components']['document_loader'] = {'error': str(e)}
         
         # Vector store stats
         try:
-            vector_stats = vector_store_manager.get_store_stats()
+            vector_stats = get_vector_store_manager().get_store_stats()
             stats['components']['vector_store'] = vector_stats
         except Exception as e:
             stats['components']['vector_store'] = {'error': str(e)}
@@ -612,16 +613,8 @@ class LangChainRunner:
         }
 
 
-def main():
-    """
-    Main entry point for command-line usage
-    
-    Educational Focus:
-    - CLI design patterns
-    - Argument parsing
-    - Input validation
-    - Output formatting
-    """
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (exposed so tests can inspect it)"""
     parser = argparse.ArgumentParser(
         description="LangChain Runner - PHP-Python Bridge",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -640,31 +633,91 @@ Examples:
     
     parser.add_argument(
         'operation',
+        nargs='?',
         help='Operation to perform',
         choices=[
             'analyze_complaint', 'answer_question', 'chat', 'create_embeddings',
             'create_vector_store', 'search_documents', 'health_check', 'get_stats'
         ]
     )
-    
+
     parser.add_argument(
         'data',
+        nargs='?',
         help='JSON data for the operation (use {} for operations that don\'t need data)'
     )
-    
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Enable verbose logging'
     )
-    
+
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Run as a long-lived worker: one JSON request per stdin '
+             'line, one JSON response per stdout line'
+    )
+
+    return parser
+
+
+def serve() -> None:
+    """
+    Long-lived worker mode for the PHP-Python bridge
+
+    Reads one JSON request ({"operation": ..., "data": ...}) per stdin
+    line and writes one JSON response per stdout line. Callers amortize
+    interpreter startup and module imports across every operation
+    instead of paying them per invocation.
+    """
+    runner = LangChainRunner()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+            result = runner.run(request['operation'], request.get('data', {}))
+        except Exception as e:
+            result = {
+                'success': False,
+                'data': None,
+                'error': str(e)
+            }
+
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+def main():
+    """
+    Main entry point for command-line usage
+
+    Educational Focus:
+    - CLI design patterns
+    - Argument parsing
+    - Input validation
+    - Output formatting
+    """
+    parser = build_arg_parser()
     args = parser.parse_args()
-    
+
     # Configure logging level
     if args.verbose:
         import logging
         logging.basicConfig(level=logging.DEBUG)
-    
+
+    if args.server:
+        serve()
+        sys.exit(0)
+
+    if args.operation is None or args.data is None:
+        parser.error('operation and data are required unless --server is given')
+
     try:
         # Parse input data
         try:
@@ -8,11 +8,21 @@ Educational Focus:
 - Rate limiting and timeout management
 """
 
+import base64
+import json
 import time
 from typing import Optional, Dict, Any, List
+import numpy as np
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from openai import OpenAI, RateLimitError, APITimeoutError, APIError
 import structlog
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 import sys
 import os
 # Add the parent directory to the path so we can import config
@@ -184,8 +194,8 @@ class OpenAIClient:
         
         for attempt in range(max_retries + 1):
             try:
-                embeddings = self.embeddings_client.embed_documents(texts)
-                
+                embeddings = self._create_embeddings_raw(texts)
+
                 logger.info("Embeddings generated successfully",
                            embedding_count=len(embeddings),
                            dimension=len(embeddings[0]) if embeddings else 0)
@@ -211,9 +221,34 @@ class OpenAIClient:
                 
                 if attempt == max_retries:
                     raise
-                
+
                 time.sleep(1)
-    
+
+    def _create_embeddings_raw(self, texts: List[str]) -> List[List[float]]:
+        """
+        Call the embeddings endpoint directly and decode base64 vectors
+
+        Requesting encoding_format="base64" makes the API return each
+        vector as base64-packed float32 bytes instead of 1536 text
+        floats, so deserialization is a base64 decode plus np.frombuffer
+        rather than thousands of float parses per vector. The response
+        body itself is parsed with orjson when available.
+        """
+        raw_response = self.openai_client.embeddings.with_raw_response.create(
+            model=config.OPENAI_EMBEDDING_MODEL,
+            input=texts,
+            encoding_format="base64",
+        )
+
+        body = raw_response.read()
+        payload = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+
+        return [
+            np.frombuffer(base64.b64decode(item["embedding"]),
+                          dtype=np.float32).tolist()
+            for item in payload["data"]
+        ]
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test OpenAI API connection and return health status
@@ -8,11 +8,23 @@ Educational Focus:
 - Consistent output formatting
 """
 
-from typing import List, Dict, Any
+import functools
+import hashlib
+import json
+import logging
+import random
+import sys
+from collections import Counter
+from typing import List, Dict, Any, Tuple
+import numpy as np
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Evaluated once: structlog still builds the event dict for filtered
+# debug calls, so hot-path getters guard on this instead
+_DEBUG = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+
 
 class FewShotExamples:
     """
@@ -28,7 +40,93 @@ class FewShotExamples:
     def __init__(self):
         """Initialize with comprehensive example set"""
         self.examples = self._load_examples()
-        
+
+        # The example set is immutable after construction, so bucket it
+        # once by risk level and category instead of rescanning on
+        # every prompt build
+        self._by_risk = {'high': [], 'medium': [], 'low': []}
+        self._by_category = {}
+
+        for example in self.examples:
+            input_data = example['input']
+            output = example['output']
+
+            # Intern the categorical strings so repeated values share one
+            # object and later dict keying/comparisons are pointer checks
+            input_data['complaint_type'] = sys.intern(input_data['complaint_type'])
+            input_data['agency'] = sys.intern(input_data['agency'])
+            output['category'] = sys.intern(output['category'])
+            # Tuples are immutable, smaller than lists, and hashable if
+            # tags ever become part of a downstream cache key
+            output['tags'] = tuple(sys.intern(tag) for tag in output['tags'])
+
+            risk_score = output['risk_score']
+            if risk_score >= 0.7:
+                self._by_risk['high'].append(example)
+            elif risk_score >= 0.4:
+                self._by_risk['medium'].append(example)
+            else:
+                self._by_risk['low'].append(example)
+
+            category_key = sys.intern(output['category'].lower())
+            self._by_category.setdefault(category_key, []).append(example)
+
+            # Pre-render the prompt block once; prompt builds then only
+            # join cached strings instead of re-interpolating f-strings
+            example['_formatted'] = self._render_example(example)
+
+        # Freeze the buckets: getters hand out these tuples directly,
+        # so no per-call list copy is needed (examples are immutable)
+        self._by_risk = {level: tuple(bucket)
+                         for level, bucket in self._by_risk.items()}
+        self._by_category = {key: tuple(bucket)
+                             for key, bucket in self._by_category.items()}
+
+        # Pre-shuffled index deck: random selections pop consecutive
+        # slices instead of paying random.sample per call, reshuffling
+        # only when the deck runs out
+        self._deck = list(range(len(self.examples)))
+        random.shuffle(self._deck)
+        self._deck_pos = 0
+
+        # Pre-joined prompt strings for the common "whole bucket" paths
+        self._all_formatted = "\n\n".join(
+            example['_formatted'] for example in self.examples
+        )
+        self._formatted_by_risk = {
+            level: "\n\n".join(example['_formatted'] for example in bucket)
+            for level, bucket in self._by_risk.items()
+        }
+
+        # Content-hash version tags: a stable short hash per formatted
+        # block lets prompt assembly detect when the static few-shot
+        # prefix changed and keep provider-side prefix caches warm
+        self.version = hashlib.blake2b(
+            self._all_formatted.encode(), digest_size=8
+        ).hexdigest()
+        self._versions = {'all': self.version}
+        for level, text in self._formatted_by_risk.items():
+            self._versions[level] = hashlib.blake2b(
+                text.encode(), digest_size=8
+            ).hexdigest()
+
+        # Risk scores as a flat float array; stats bucketing (and any
+        # future score-range queries) run as NumPy reductions instead of
+        # per-example Python comparisons as the example set grows
+        self._scores = np.fromiter(
+            (example['output']['risk_score'] for example in self.examples),
+            dtype=np.float32,
+            count=len(self.examples)
+        )
+
+        # Score-sorted view for range queries: searchsorted gives any
+        # [lo, hi) slice in O(log N) regardless of example-set size
+        order = np.argsort(self._scores, kind='stable')
+        self._sorted_scores = self._scores[order]
+        self._sorted_examples = tuple(self.examples[i] for i in order)
+
+        self._stats = self._compute_stats()
+
         logger.info("FewShotExamples initialized",
                    example_count=len(self.examples))
     
@@ -194,95 +292,123 @@ class FewShotExamples:
             }
         ]
     
-    def get_examples_by_risk_level(self, risk_level: str) -> List[Dict[str, Any]]:
+    def get_examples_by_risk_level(self, risk_level: str) -> Tuple[Dict[str, Any], ...]:
         """
         Get examples filtered by risk level
-        
+
         Args:
             risk_level: 'high', 'medium', or 'low'
-            
+
         Returns:
-            List of examples for the specified risk level
+            Read-only tuple of examples for the specified risk level
         """
-        risk_ranges = {
-            'high': (0.7, 1.0),
-            'medium': (0.4, 0.7),
-            'low': (0.0, 0.4)
-        }
-        
-        if risk_level not in risk_ranges:
-            raise ValueError(f"Risk level must be one of: {list(risk_ranges.keys())}")
-        
-        min_risk, max_risk = risk_ranges[risk_level]
-        
-        filtered_examples = [
-            example for example in self.examples
-            if min_risk <= example['output']['risk_score'] < max_risk
-        ]
-        
-        logger.debug("Filtered examples by risk level",
-                    risk_level=risk_level,
-                    example_count=len(filtered_examples))
-        
+        if risk_level not in self._by_risk:
+            raise ValueError(f"Risk level must be one of: {list(self._by_risk.keys())}")
+
+        filtered_examples = self._by_risk[risk_level]
+
+        if _DEBUG:
+            logger.debug("Filtered examples by risk level",
+                        risk_level=risk_level,
+                        example_count=len(filtered_examples))
+
         return filtered_examples
     
-    def get_examples_by_category(self, category: str) -> List[Dict[str, Any]]:
+    def get_examples_by_category(self, category: str) -> Tuple[Dict[str, Any], ...]:
         """
         Get examples filtered by category
-        
+
         Args:
             category: Category name to filter by
-            
+
         Returns:
-            List of examples for the specified category
+            Read-only tuple of examples for the specified category
         """
-        filtered_examples = [
-            example for example in self.examples
-            if example['output']['category'].lower() == category.lower()
-        ]
-        
-        logger.debug("Filtered examples by category",
-                    category=category,
-                    example_count=len(filtered_examples))
+        # Bucket keys are pre-lowered, so only the input needs normalizing
+        filtered_examples = self._by_category.get(category.lower(), ())
+
+        if _DEBUG:
+            logger.debug("Filtered examples by category",
+                        category=category,
+                        example_count=len(filtered_examples))
         
         return filtered_examples
     
-    def get_random_examples(self, count: int = 3) -> List[Dict[str, Any]]:
+    def get_random_examples(self, count: int = 3) -> Tuple[Dict[str, Any], ...]:
         """
         Get random selection of examples for few-shot prompting
-        
+
         Args:
             count: Number of examples to return
-            
+
         Returns:
-            Random selection of examples
+            Read-only tuple of randomly selected examples
         """
-        import random
-        
         if count >= len(self.examples):
-            return self.examples.copy()
-        
-        selected = random.sample(self.examples, count)
-        
-        logger.debug("Selected random examples",
-                    requested_count=count,
-                    selected_count=len(selected))
-        
+            return tuple(self.examples)
+
+        # Draw indices from the pre-shuffled deck and return the cached
+        # example objects directly
+        selected = tuple(self.examples[i] for i in self._draw_indices(count))
+
+        if _DEBUG:
+            logger.debug("Selected random examples",
+                        requested_count=count,
+                        selected_count=len(selected))
+
         return selected
-    
-    def format_example_for_prompt(self, example: Dict[str, Any]) -> str:
+
+    def get_random_formatted(self, count: int = 3) -> str:
         """
-        Format a single example for inclusion in few-shot prompt
-        
+        Get random examples already formatted for prompt inclusion
+
+        Fast path for prompt builders: samples indices against the
+        pre-rendered strings and joins them, skipping the intermediate
+        list of example dicts entirely.
+
         Args:
-            example: Example dictionary with input/output
-            
+            count: Number of examples to include
+
         Returns:
-            Formatted example string
+            Formatted examples string
+        """
+        if not self.examples:
+            return "No examples available."
+
+        indices = self._draw_indices(min(count, len(self.examples)))
+
+        return "\n\n".join(self.examples[i]['_formatted'] for i in indices)
+
+    def _draw_indices(self, count: int) -> List[int]:
+        """
+        Draw distinct example indices from the pre-shuffled deck
+
+        Amortized O(1) per draw: consumes consecutive slices of a
+        shuffled index permutation and reshuffles only on exhaustion,
+        instead of running random.sample on every call.
+        """
+        if self._deck_pos + count > len(self._deck):
+            random.shuffle(self._deck)
+            self._deck_pos = 0
+
+        indices = self._deck[self._deck_pos:self._deck_pos + count]
+        self._deck_pos += count
+
+        return indices
+    
+    def _render_example(self, example: Dict[str, Any]) -> str:
+        """
+        Render a single example into its few-shot prompt block
+
+        Called once per example at load time; the result is cached on
+        the example dict so prompt builds never re-interpolate.
         """
         input_data = example['input']
-        output_data = example['output']
-        
+
+        # json.dumps renders the whole Output block in one C-level call
+        # and guarantees valid JSON even if a summary contains quotes
+        output_block = json.dumps(example['output'], ensure_ascii=False, indent=4)
+
         formatted = f"""
 EXAMPLE:
 Input:
@@ -293,60 +419,170 @@ Input:
 - Submitted: {input_data['submitted_at']}
 
 Output:
-{{
-    "risk_score": {output_data['risk_score']},
-    "category": "{output_data['category']}",
-    "summary": "{output_data['summary']}",
-    "tags": {output_data['tags']}
-}}
+{output_block}
 """
         return formatted.strip()
-    
+
+    def format_example_for_prompt(self, example: Dict[str, Any]) -> str:
+        """
+        Format a single example for inclusion in few-shot prompt
+
+        Args:
+            example: Example dictionary with input/output
+
+        Returns:
+            Formatted example string
+        """
+        cached = example.get('_formatted')
+        if cached is not None:
+            return cached
+
+        return self._render_example(example)
+
     def format_examples_for_prompt(self, examples: List[Dict[str, Any]]) -> str:
         """
         Format multiple examples for few-shot prompt
-        
+
         Args:
             examples: List of example dictionaries
-            
+
         Returns:
             Formatted examples string
         """
         if not examples:
             return "No examples available."
-        
-        formatted_examples = [
+
+        # Full-set fast path: the joined string is precomputed at init
+        if examples is self.examples:
+            return self._all_formatted
+
+        return "\n\n".join(
             self.format_example_for_prompt(example)
             for example in examples
-        ]
-        
-        return "\n\n".join(formatted_examples)
+        )
+
+    def get_formatted_by_risk_level(self, risk_level: str) -> str:
+        """
+        Get the pre-joined formatted examples for a risk level
+
+        Args:
+            risk_level: 'high', 'medium', or 'low'
+
+        Returns:
+            Formatted examples string for that bucket
+        """
+        if risk_level not in self._formatted_by_risk:
+            raise ValueError(f"Risk level must be one of: {list(self._formatted_by_risk.keys())}")
+
+        return self._formatted_by_risk[risk_level] or "No examples available."
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about the example set"""
-        categories = {}
-        risk_levels = {'high': 0, 'medium': 0, 'low': 0}
-        
-        for example in self.examples:
-            # Count categories
-            category = example['output']['category']
-            categories[category] = categories.get(category, 0) + 1
-            
-            # Count risk levels
-            risk_score = example['output']['risk_score']
-            if risk_score >= 0.7:
-                risk_levels['high'] += 1
-            elif risk_score >= 0.4:
-                risk_levels['medium'] += 1
-            else:
-                risk_levels['low'] += 1
-        
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Compute example-set statistics once at load time"""
+        categories = dict(Counter(
+            example['output']['category'] for example in self.examples
+        ))
+
+        # Bucket all scores in one vectorized searchsorted + bincount
+        # instead of an if/elif chain per example
+        buckets = np.searchsorted(
+            np.array([0.4, 0.7], dtype=np.float32),
+            self._scores,
+            side='right'
+        )
+        counts = np.bincount(buckets, minlength=3)
+        risk_levels = {
+            'low': int(counts[0]),
+            'medium': int(counts[1]),
+            'high': int(counts[2])
+        }
+
         return {
             'total_examples': len(self.examples),
             'categories': categories,
             'risk_levels': risk_levels
         }
 
+    def get_examples_by_score_range(self, min_score: float,
+                                    max_score: float) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get examples whose risk score falls in [min_score, max_score)
+
+        Uses the score-sorted index built at init, so the lookup is a
+        binary search plus a slice rather than a scan of every example.
+
+        Args:
+            min_score: Inclusive lower bound
+            max_score: Exclusive upper bound
+
+        Returns:
+            Read-only tuple of matching examples, ordered by score
+        """
+        lo = int(np.searchsorted(self._sorted_scores, min_score, side='left'))
+        hi = int(np.searchsorted(self._sorted_scores, max_score, side='left'))
+
+        return self._sorted_examples[lo:hi]
+
+    def get_formatted_block(self, kind: str = 'all') -> Tuple[str, str]:
+        """
+        Get a pre-rendered example block with its content-hash version
+
+        Prompt assembly should use the text as a static system-prompt
+        prefix and key any caching on the version tag; per-request data
+        belongs in a separate message so the prefix stays byte-stable.
+
+        Args:
+            kind: 'all' or a risk level ('high', 'medium', 'low')
+
+        Returns:
+            (formatted examples string, 8-byte hex version tag)
+        """
+        if kind not in self._versions:
+            raise ValueError(f"Block kind must be one of: {list(self._versions.keys())}")
+
+        text = self._all_formatted if kind == 'all' else self._formatted_by_risk[kind]
+
+        return text, self._versions[kind]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about the example set"""
+        return self._stats
+
+
+# Lazy global accessor: defers example construction (and the bucket /
+# pre-render work in __init__) until the examples are actually needed,
+# keeping import time flat for callers that only want SystemPrompts
+@functools.cache
+def get_few_shot_examples() -> FewShotExamples:
+    """Get the shared FewShotExamples instance, creating it on first use"""
+    return FewShotExamples()
+
+
+# Module-level entry points for the common lookups. These skip the
+# attribute chain on the singleton for callers that just want data;
+# the class stays as the implementation (it owns the lazy-built
+# buckets and sampling deck) and for callers that manage their own
+# instance.
+
+def get_examples_by_risk_level(risk_level: str) -> Tuple[Dict[str, Any], ...]:
+    """Get examples filtered by risk level from the shared instance"""
+    return get_few_shot_examples().get_examples_by_risk_level(risk_level)
+
+
+def get_examples_by_category(category: str) -> Tuple[Dict[str, Any], ...]:
+    """Get examples filtered by category from the shared instance"""
+    return get_few_shot_examples().get_examples_by_category(category)
+
+
+def get_random_examples(count: int = 3) -> Tuple[Dict[str, Any], ...]:
+    """Get random examples from the shared instance"""
+    return get_few_shot_examples().get_random_examples(count)
+
+
+def format_examples_for_prompt(examples: List[Dict[str, Any]]) -> str:
+    """Format examples for prompt inclusion via the shared instance"""
+    return get_few_shot_examples().format_examples_for_prompt(examples)
+
 
-# Global examples instance
-few_shot_examples = FewShotExamples()
\ No newline at end of file
+def get_stats() -> Dict[str, Any]:
+    """Get example-set statistics from the shared instance"""
+    return get_few_shot_examples().get_stats()
\ No newline at end of file
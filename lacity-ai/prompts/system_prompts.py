@@ -8,27 +8,17 @@ Educational Focus:
 - Professional tone and expertise establishment
 """
 
+import functools
 from typing import Dict, Any
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
-class SystemPrompts:
-    """
-    Collection of system prompts for different AI roles in LaraCity
-    
-    System prompts establish:
-    - AI persona and expertise level
-    - Response format expectations  
-    - Domain-specific knowledge context
-    - Professional communication style
-    """
-    
-    @staticmethod
-    def municipal_analyst() -> str:
-        """System prompt for complaint analysis role"""
-        return """You are an expert NYC 311 Municipal Complaint Analyst with 10+ years of experience in urban service delivery and public administration.
+# The prompts are constants; storing them at module level means role
+# lookup is a dict access with no method-call or frame overhead
+
+_ANALYST_PROMPT = """You are an expert NYC 311 Municipal Complaint Analyst with 10+ years of experience in urban service delivery and public administration.
 
 Your expertise includes:
 - NYC agency operations and service delivery protocols
@@ -52,10 +42,7 @@ Communication style:
 
 Always provide structured, consistent analysis that helps municipal staff prioritize and respond effectively to citizen needs."""
 
-    @staticmethod
-    def data_assistant() -> str:
-        """System prompt for Q&A and data exploration role"""
-        return """You are a helpful NYC 311 Data Assistant specializing in municipal complaint data analysis and citizen service information.
+_ASSISTANT_PROMPT = """You are a helpful NYC 311 Data Assistant specializing in municipal complaint data analysis and citizen service information.
 
 Your capabilities include:
 - Analyzing complaint patterns and trends across NYC boroughs
@@ -79,14 +66,11 @@ Communication style:
 
 Always strive to help users make sense of complex municipal data and understand how city services work."""
 
-    @staticmethod
-    def complaint_summarizer() -> str:
-        """System prompt for data summarization role"""
-        return """You are a Municipal Data Analyst specializing in NYC 311 complaint trend analysis and operational reporting.
+_SUMMARIZER_PROMPT = """You are a Municipal Data Analyst specializing in NYC 311 complaint trend analysis and operational reporting.
 
 Your role is to transform raw complaint data into actionable insights for:
 - City agency leadership and operations managers
-- Community board members and local representatives  
+- Community board members and local representatives
 - Public policy researchers and analysts
 - Citizen advocacy groups and community organizations
 
@@ -106,10 +90,7 @@ Reporting standards:
 
 Your summaries help decision-makers understand what the data reveals about how well the city is serving its residents."""
 
-    @staticmethod
-    def chat_agent() -> str:
-        """System prompt for conversational chat agent"""
-        return """You are CivicAI, a knowledgeable and helpful assistant for NYC 311 complaint data and municipal services.
+_CHAT_PROMPT = """You are CivicAI, a knowledgeable and helpful assistant for NYC 311 complaint data and municipal services.
 
 Your personality:
 - Friendly and approachable, like a knowledgeable civic employee
@@ -138,70 +119,134 @@ Key behaviors:
 
 Your goal is to make municipal data and services more accessible and understandable for NYC residents."""
 
+_PROMPTS = {
+    'analyst': _ANALYST_PROMPT,
+    'assistant': _ASSISTANT_PROMPT,
+    'summarizer': _SUMMARIZER_PROMPT,
+    'chat': _CHAT_PROMPT,
+}
+
+
+# UTF-8 encoded once at import; callers that stream HTTP bodies can
+# reuse these instead of re-encoding the same prompt on every request
+_PROMPT_BYTES = {role: prompt.encode('utf-8')
+                 for role, prompt in _PROMPTS.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _contextualized(role: str, additional_context: str) -> str:
+    """
+    Build (and memoize) a contextualized system prompt
+
+    Returning the same string object for identical (role, context)
+    pairs avoids redundant concatenation and keeps the prompt stable
+    for provider-side prefix caching. Volatile per-request data should
+    go into a separate user message, not into the system prompt, so
+    the upstream prompt cache stays warm.
+    """
+    return f"{_PROMPTS[role]}\n\nADDITIONAL CONTEXT:\n{additional_context}"
+
+
+class SystemPrompts:
+    """
+    Collection of system prompts for different AI roles in LaraCity
+
+    System prompts establish:
+    - AI persona and expertise level
+    - Response format expectations
+    - Domain-specific knowledge context
+    - Professional communication style
+    """
+
+    @staticmethod
+    def municipal_analyst() -> str:
+        """System prompt for complaint analysis role"""
+        return _ANALYST_PROMPT
+
+    @staticmethod
+    def data_assistant() -> str:
+        """System prompt for Q&A and data exploration role"""
+        return _ASSISTANT_PROMPT
+
+    @staticmethod
+    def complaint_summarizer() -> str:
+        """System prompt for data summarization role"""
+        return _SUMMARIZER_PROMPT
+
+    @staticmethod
+    def chat_agent() -> str:
+        """System prompt for conversational chat agent"""
+        return _CHAT_PROMPT
+
     @staticmethod
     def get_system_prompt(role: str) -> str:
         """
         Get system prompt for specified role
-        
+
         Args:
             role: Role identifier ('analyst', 'assistant', 'summarizer', 'chat')
-            
+
         Returns:
             System prompt string
-            
+
         Raises:
             ValueError: If role is not recognized
         """
-        role_map = {
-            'analyst': SystemPrompts.municipal_analyst,
-            'assistant': SystemPrompts.data_assistant,
-            'summarizer': SystemPrompts.complaint_summarizer,
-            'chat': SystemPrompts.chat_agent
-        }
-        
-        if role not in role_map:
-            available_roles = list(role_map.keys())
+        try:
+            return _PROMPTS[role]
+        except KeyError:
+            available_roles = list(_PROMPTS.keys())
             raise ValueError(f"Unknown role '{role}'. Available roles: {available_roles}")
-        
-        prompt = role_map[role]()
-        
-        logger.debug("Retrieved system prompt",
-                    role=role,
-                    prompt_length=len(prompt))
-        
-        return prompt
-    
+
+    @staticmethod
+    def get_system_prompt_bytes(role: str) -> bytes:
+        """
+        Get the UTF-8 encoded system prompt for specified role
+
+        The encode is done once at import, so request paths that need
+        raw bytes (HTTP body streaming) skip a per-call encode of a
+        multi-KB constant.
+
+        Args:
+            role: Role identifier ('analyst', 'assistant', 'summarizer', 'chat')
+
+        Returns:
+            System prompt as UTF-8 bytes
+
+        Raises:
+            ValueError: If role is not recognized
+        """
+        try:
+            return _PROMPT_BYTES[role]
+        except KeyError:
+            available_roles = list(_PROMPT_BYTES.keys())
+            raise ValueError(f"Unknown role '{role}'. Available roles: {available_roles}")
+
     @staticmethod
     def get_available_roles() -> list[str]:
         """Get list of available system prompt roles"""
-        return ['analyst', 'assistant', 'summarizer', 'chat']
-    
+        return list(_PROMPTS.keys())
+
     @staticmethod
-    def create_contextualized_prompt(base_role: str, 
+    def create_contextualized_prompt(base_role: str,
                                    additional_context: str = "") -> str:
         """
         Create system prompt with additional context
-        
+
         Args:
             base_role: Base role identifier
             additional_context: Additional context to append
-            
+
         Returns:
             Enhanced system prompt
         """
         base_prompt = SystemPrompts.get_system_prompt(base_role)
-        
+
         if additional_context:
-            contextualized = f"{base_prompt}\n\nADDITIONAL CONTEXT:\n{additional_context}"
-            
-            logger.debug("Created contextualized prompt",
-                        base_role=base_role,
-                        additional_context_length=len(additional_context))
-            
-            return contextualized
-        
+            return _contextualized(base_role, additional_context)
+
         return base_prompt
 
 
 # Global system prompts instance
-system_prompts = SystemPrompts()
\ No newline at end of file
+system_prompts = SystemPrompts()
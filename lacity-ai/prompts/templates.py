@@ -8,10 +8,18 @@ Educational Focus:
 - NYC 311 domain-specific prompting
 """
 
+import functools
+import json
 from langchain.prompts import PromptTemplate, FewShotPromptTemplate
 from typing import List, Dict, Any
 import structlog
 
+import sys
+import os
+# Add the parent directory to the path so we can import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import config
+
 logger = structlog.get_logger(__name__)
 
 
@@ -25,32 +33,68 @@ class ComplaintAnalysisTemplate:
     - Summary generation
     - Tag extraction
     """
-    
+
+    # JSON-Schema for the analysis response. Binding this to the
+    # provider's structured-output mode (response_format with
+    # json_schema) constrains decoding to valid JSON, so downstream
+    # parsing needs no repair/retry path and the in-prompt example
+    # block is unnecessary
+    ANALYSIS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "risk_score": {"type": "number", "minimum": 0, "maximum": 1},
+            "category": {
+                "enum": [
+                    "Infrastructure",
+                    "Transportation",
+                    "Quality of Life",
+                    "Public Health",
+                    "Public Safety"
+                ]
+            },
+            "summary": {"type": "string"},
+            "tags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": 3,
+                "maxItems": 5
+            }
+        },
+        "required": ["risk_score", "category", "summary", "tags"],
+        "additionalProperties": False
+    }
+
     def __init__(self):
         """Initialize complaint analysis template"""
-        self.template = PromptTemplate(
-            input_variables=[
-                "complaint_type", 
-                "description", 
-                "location", 
-                "agency",
-                "submitted_at"
-            ],
-            template=self._get_analysis_template()
-        )
-        
+        # Static rubric is built once; the dynamic complaint block is
+        # the only per-call substitution, so providers can cache the
+        # static part as a stable system-message prefix
+        self._static_system = self._get_static_system()
+        # Plain str.format on the raw template string: one C-level
+        # interpolation per call, no LangChain re-parse/validation
+        self._user_template = self._get_user_template()
+        self._langchain_template = None
+
         logger.info("ComplaintAnalysisTemplate initialized")
-    
-    def _get_analysis_template(self) -> str:
-        """Get the main analysis template string"""
-        return """You are an expert municipal complaint analyst for New York City. Analyze this 311 complaint and provide a structured assessment.
 
-COMPLAINT DETAILS:
-- Type: {complaint_type}
-- Description: {description}
-- Location: {location}
-- Responsible Agency: {agency}
-- Submitted: {submitted_at}
+    def as_langchain(self) -> PromptTemplate:
+        """Get a LangChain PromptTemplate view (built on first use)"""
+        if self._langchain_template is None:
+            self._langchain_template = PromptTemplate(
+                input_variables=[
+                    "complaint_type",
+                    "description",
+                    "location",
+                    "agency",
+                    "submitted_at"
+                ],
+                template=self._user_template
+            )
+        return self._langchain_template
+
+    def _get_static_system(self) -> str:
+        """Get the static instruction text (no placeholders, cacheable)"""
+        return """You are an expert municipal complaint analyst for New York City. Analyze the 311 complaint provided by the user and provide a structured assessment.
 
 ANALYSIS REQUIREMENTS:
 1. Risk Score (0.0-1.0): Assess urgency and potential impact
@@ -70,23 +114,176 @@ ANALYSIS REQUIREMENTS:
 
 4. Tags: 3-5 relevant keywords for search and filtering
 
-RESPONSE FORMAT (JSON):
-{{
-    "risk_score": 0.0,
-    "category": "Category Name",
-    "summary": "Clear, actionable summary of the complaint and recommended response.",
-    "tags": ["tag1", "tag2", "tag3", "tag4"]
-}}
+Respond with a single JSON object containing risk_score, category, summary and tags.
 
 Consider factors like:
 - Potential for escalation or spreading
 - Impact on public safety and health
 - Infrastructure dependencies
 - Time-sensitivity of the issue
-- Resource requirements for resolution
+- Resource requirements for resolution"""
+
+    def _get_user_template(self) -> str:
+        """Get the dynamic per-complaint template string"""
+        return """COMPLAINT DETAILS:
+- Type: {complaint_type}
+- Description: {description}
+- Location: {location}
+- Responsible Agency: {agency}
+- Submitted: {submitted_at}
 
 Provide your analysis:"""
-    
+
+    def get_response_schema(self) -> Dict[str, Any]:
+        """
+        Get the JSON-Schema for a single-complaint analysis response
+
+        Call sites bind this to the provider's structured-output mode
+        (e.g. response_format={"type": "json_schema", ...}) so decoding
+        is constrained to schema-valid JSON.
+        """
+        return self.ANALYSIS_SCHEMA
+
+    def get_batch_response_schema(self) -> Dict[str, Any]:
+        """Get the JSON-Schema for a batch (array) analysis response"""
+        item = dict(self.ANALYSIS_SCHEMA)
+        item_properties = dict(item['properties'])
+        item_properties['id'] = {"type": "integer", "minimum": 1}
+        item['properties'] = item_properties
+        item['required'] = ['id'] + list(self.ANALYSIS_SCHEMA['required'])
+        return {"type": "array", "items": item}
+
+    def _get_batch_analysis_template(self) -> str:
+        """Get the batch analysis template string (shared rubric, N complaints)"""
+        return """You are an expert municipal complaint analyst for New York City. Analyze each of the following 311 complaints and provide a structured assessment for every one.
+
+ANALYSIS REQUIREMENTS (apply to each complaint):
+1. Risk Score (0.0-1.0): Assess urgency and potential impact
+   - 0.9-1.0: Critical/Emergency (gas leaks, structural damage, immediate danger)
+   - 0.7-0.8: High Priority (water outages, heat issues, traffic hazards)
+   - 0.4-0.6: Medium Priority (street conditions, sanitation issues)
+   - 0.0-0.3: Low Priority (noise complaints, minor parking violations)
+
+2. Category: Classify into primary service area
+   - Infrastructure (water, gas, electricity, structural)
+   - Transportation (traffic, parking, street conditions)
+   - Quality of Life (noise, odors, aesthetics)
+   - Public Health (sanitation, food safety, environmental)
+   - Public Safety (emergency response, hazards)
+
+3. Summary: 2-3 sentence explanation of the issue and recommended action
+
+4. Tags: 3-5 relevant keywords for search and filtering
+
+COMPLAINTS:
+{complaints_block}
+
+Respond with a JSON array, one object per complaint in the same order, each containing id, risk_score, category, summary and tags.
+
+Provide your analyses:"""
+
+    def format_batch_prompt(self, complaints: List[Dict[str, Any]]) -> str:
+        """
+        Format one prompt covering a batch of complaints
+
+        Batching amortizes the shared rubric (roughly 500 tokens of
+        instructions and schema) across the whole batch instead of
+        re-sending it per complaint. Use parse_batch_response to map
+        the JSON array response back to complaint ids.
+
+        Args:
+            complaints: List of complaint dictionaries (one batch)
+
+        Returns:
+            Formatted batch prompt string
+
+        Raises:
+            ValueError: If the batch is empty or too large to prompt
+                        reliably (accuracy degrades on oversized batches)
+        """
+        if not complaints:
+            raise ValueError("Batch cannot be empty")
+
+        complaint_blocks = [
+            f"[{i}] TYPE: {c.get('type', 'Unknown')}\n"
+            f"DESCRIPTION: {c.get('description', 'No description provided')}\n"
+            f"LOCATION: {c.get('borough', 'Unknown')}, {c.get('address', 'Address not specified')}\n"
+            f"AGENCY: {c.get('agency', 'Unknown Agency')}\n"
+            f"SUBMITTED: {c.get('submitted_at', 'Unknown time')}"
+            for i, c in enumerate(complaints, 1)
+        ]
+
+        formatted = self._get_batch_analysis_template().format(
+            complaints_block="\n---\n".join(complaint_blocks)
+        )
+
+        # Rough 4-chars-per-token estimate; oversized batch prompts hit
+        # a quality cliff, so callers should split and retry smaller
+        estimated_tokens = len(formatted) // 4
+        if estimated_tokens > config.BATCH_PROMPT_TOKEN_LIMIT:
+            raise ValueError(
+                f"Batch prompt too large (~{estimated_tokens} tokens, "
+                f"limit {config.BATCH_PROMPT_TOKEN_LIMIT}); use a smaller batch"
+            )
+
+        logger.debug("Batch analysis prompt formatted",
+                    batch_size=len(complaints),
+                    prompt_length=len(formatted))
+
+        return formatted
+
+    def parse_batch_response(self,
+                            response_text: str,
+                            complaint_ids: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Parse a batch analysis response back to per-complaint results
+
+        Args:
+            response_text: Raw LLM response (JSON array expected)
+            complaint_ids: Complaint ids in the same order as the batch
+
+        Returns:
+            Mapping of complaint id -> analysis dict
+        """
+        text = response_text.strip()
+
+        # Strip common markdown code fences
+        if text.startswith('```'):
+            text = text.split('```')[1]
+            if text.startswith('json'):
+                text = text[4:]
+            text = text.strip()
+
+        try:
+            analyses = json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse batch analysis response",
+                        error=str(e),
+                        response_preview=response_text[:200])
+            return {}
+
+        if not isinstance(analyses, list):
+            logger.error("Batch response is not a JSON array",
+                        response_type=type(analyses).__name__)
+            return {}
+
+        results = {}
+        for position, analysis in enumerate(analyses):
+            if not isinstance(analysis, dict):
+                continue
+
+            # Prefer the model's [i] index; fall back to array position
+            index = analysis.get('id', position + 1)
+            if isinstance(index, int) and 1 <= index <= len(complaint_ids):
+                analysis = {k: v for k, v in analysis.items() if k != 'id'}
+                results[complaint_ids[index - 1]] = analysis
+
+        logger.debug("Batch analysis response parsed",
+                    expected=len(complaint_ids),
+                    parsed=len(results))
+
+        return results
+
     def format_prompt(self, complaint_data: Dict[str, Any]) -> str:
         """
         Format prompt with complaint data
@@ -97,21 +294,38 @@ Provide your analysis:"""
         Returns:
             Formatted prompt string
         """
+        messages = self.format_prompt_messages(complaint_data)
+        return f"{messages['system']}\n\n{messages['user']}"
+
+    def format_prompt_messages(self, complaint_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Format prompt as separate system/user messages
+
+        The static rubric goes into the system message (byte-identical
+        across calls, so provider-side prompt caching applies) and only
+        the complaint details vary in the user message.
+
+        Args:
+            complaint_data: Dictionary containing complaint information
+
+        Returns:
+            Dict with 'system' and 'user' message strings
+        """
         try:
-            formatted = self.template.format(
+            user_message = self._user_template.format(
                 complaint_type=complaint_data.get('type', 'Unknown'),
                 description=complaint_data.get('description', 'No description provided'),
                 location=f"{complaint_data.get('borough', 'Unknown')}, {complaint_data.get('address', 'Address not specified')}",
                 agency=complaint_data.get('agency', 'Unknown Agency'),
                 submitted_at=complaint_data.get('submitted_at', 'Unknown time')
             )
-            
+
             logger.debug("Complaint analysis prompt formatted",
                         complaint_id=complaint_data.get('id'),
-                        prompt_length=len(formatted))
-            
-            return formatted
-            
+                        prompt_length=len(user_message))
+
+            return {'system': self._static_system, 'user': user_message}
+
         except Exception as e:
             logger.error("Failed to format complaint analysis prompt",
                         complaint_data=complaint_data,
@@ -128,29 +342,28 @@ class QuestionAnsweringTemplate:
     
     def __init__(self):
         """Initialize question answering template"""
-        self.template = PromptTemplate(
-            input_variables=[
-                "question",
-                "context_complaints",
-                "conversation_history"
-            ],
-            template=self._get_qa_template()
-        )
-        
-        logger.info("QuestionAnsweringTemplate initialized")
-    
-    def _get_qa_template(self) -> str:
-        """Get the Q&A template string"""
-        return """You are a helpful NYC 311 data assistant. Answer the user's question based on the provided complaint data context.
+        self._static_system = self._get_static_system()
+        self._user_template = self._get_user_template()
+        self._langchain_template = None
 
-CONVERSATION HISTORY:
-{conversation_history}
+        logger.info("QuestionAnsweringTemplate initialized")
 
-USER QUESTION:
-{question}
+    def as_langchain(self) -> PromptTemplate:
+        """Get a LangChain PromptTemplate view (built on first use)"""
+        if self._langchain_template is None:
+            self._langchain_template = PromptTemplate(
+                input_variables=[
+                    "question",
+                    "context_complaints",
+                    "conversation_history"
+                ],
+                template=self._user_template
+            )
+        return self._langchain_template
 
-RELEVANT COMPLAINT DATA:
-{context_complaints}
+    def _get_static_system(self) -> str:
+        """Get the static instruction text (no placeholders, cacheable)"""
+        return """You are a helpful NYC 311 data assistant. Answer the user's question based on the provided complaint data context.
 
 INSTRUCTIONS:
 1. Answer the question accurately using only the provided complaint data
@@ -158,7 +371,18 @@ INSTRUCTIONS:
 3. Provide specific numbers, locations, and details when available
 4. Suggest follow-up questions or clarifications if helpful
 5. Be concise but informative
-6. Use a helpful, professional tone
+6. Use a helpful, professional tone"""
+
+    def _get_user_template(self) -> str:
+        """Get the dynamic per-question template string"""
+        return """CONVERSATION HISTORY:
+{conversation_history}
+
+USER QUESTION:
+{question}
+
+RELEVANT COMPLAINT DATA:
+{context_complaints}
 
 ANSWER:"""
     
@@ -177,23 +401,46 @@ ANSWER:"""
         Returns:
             Formatted prompt string
         """
+        messages = self.format_prompt_messages(
+            question, context_complaints, conversation_history
+        )
+        return f"{messages['system']}\n\n{messages['user']}"
+
+    def format_prompt_messages(self,
+                              question: str,
+                              context_complaints: List[Dict[str, Any]],
+                              conversation_history: str = "") -> Dict[str, str]:
+        """
+        Format Q&A prompt as separate system/user messages
+
+        The static instructions form the cacheable system message; the
+        question, context and history are the per-call user message.
+
+        Args:
+            question: User's question
+            context_complaints: List of relevant complaints for context
+            conversation_history: Previous conversation context
+
+        Returns:
+            Dict with 'system' and 'user' message strings
+        """
         # Format complaint context
         context_text = self._format_complaint_context(context_complaints)
-        
+
         try:
-            formatted = self.template.format(
+            user_message = self._user_template.format(
                 question=question,
                 context_complaints=context_text,
                 conversation_history=conversation_history or "No previous conversation."
             )
-            
+
             logger.debug("Q&A prompt formatted",
                         question_length=len(question),
                         context_complaints=len(context_complaints),
-                        prompt_length=len(formatted))
-            
-            return formatted
-            
+                        prompt_length=len(user_message))
+
+            return {'system': self._static_system, 'user': user_message}
+
         except Exception as e:
             logger.error("Failed to format Q&A prompt",
                         question=question[:100],
@@ -204,21 +451,21 @@ ANSWER:"""
         """Format complaint data for context"""
         if not complaints:
             return "No relevant complaints found in the database."
-        
-        context_parts = []
-        for i, complaint in enumerate(complaints, 1):
-            context_parts.append(f"""
-Complaint #{i}:
-- ID: {complaint.get('id', 'Unknown')}
-- Type: {complaint.get('type', 'Unknown')}
-- Description: {complaint.get('description', 'No description')}
-- Location: {complaint.get('borough', 'Unknown')}, {complaint.get('address', 'Address not specified')}
-- Agency: {complaint.get('agency', 'Unknown')}
-- Status: {complaint.get('status', 'Unknown')}
-- Submitted: {complaint.get('submitted_at', 'Unknown')}
-""")
-        
-        return "\n".join(context_parts)
+
+        # One f-string per complaint fed straight into a single join;
+        # str.join materializes the generator once and concatenates in
+        # C, with no intermediate list growth at large k
+        return "\n".join(
+            f"\nComplaint #{i}:\n"
+            f"- ID: {c.get('id', 'Unknown')}\n"
+            f"- Type: {c.get('type', 'Unknown')}\n"
+            f"- Description: {c.get('description', 'No description')}\n"
+            f"- Location: {c.get('borough', 'Unknown')}, {c.get('address', 'Address not specified')}\n"
+            f"- Agency: {c.get('agency', 'Unknown')}\n"
+            f"- Status: {c.get('status', 'Unknown')}\n"
+            f"- Submitted: {c.get('submitted_at', 'Unknown')}\n"
+            for i, c in enumerate(complaints, 1)
+        )
 
 
 class SummarizationTemplate:
@@ -228,26 +475,28 @@ class SummarizationTemplate:
     
     def __init__(self):
         """Initialize summarization template"""
-        self.template = PromptTemplate(
-            input_variables=[
-                "complaints_data",
-                "summary_type",
-                "time_period"
-            ],
-            template=self._get_summary_template()
-        )
-        
+        self._static_system = self._get_static_system()
+        self._user_template = self._get_user_template()
+        self._langchain_template = None
+
         logger.info("SummarizationTemplate initialized")
-    
-    def _get_summary_template(self) -> str:
-        """Get the summarization template string"""
-        return """Analyze and summarize the following NYC 311 complaint data.
 
-SUMMARY TYPE: {summary_type}
-TIME PERIOD: {time_period}
+    def as_langchain(self) -> PromptTemplate:
+        """Get a LangChain PromptTemplate view (built on first use)"""
+        if self._langchain_template is None:
+            self._langchain_template = PromptTemplate(
+                input_variables=[
+                    "complaints_data",
+                    "summary_type",
+                    "time_period"
+                ],
+                template=self._user_template
+            )
+        return self._langchain_template
 
-COMPLAINT DATA:
-{complaints_data}
+    def _get_static_system(self) -> str:
+        """Get the static instruction text (no placeholders, cacheable)"""
+        return """Analyze and summarize the NYC 311 complaint data provided by the user.
 
 Please provide a comprehensive summary including:
 
@@ -272,6 +521,14 @@ Please provide a comprehensive summary including:
    - Process improvements
 
 Format your response clearly with bullet points and specific data points where available."""
+
+    def _get_user_template(self) -> str:
+        """Get the dynamic per-summary template string"""
+        return """SUMMARY TYPE: {summary_type}
+TIME PERIOD: {time_period}
+
+COMPLAINT DATA:
+{complaints_data}"""
     
     def format_prompt(self,
                      complaints_data: str,
@@ -288,20 +545,40 @@ Format your response clearly with bullet points and specific data points where a
         Returns:
             Formatted prompt string
         """
+        messages = self.format_prompt_messages(
+            complaints_data, summary_type, time_period
+        )
+        return f"{messages['system']}\n\n{messages['user']}"
+
+    def format_prompt_messages(self,
+                              complaints_data: str,
+                              summary_type: str = "General Summary",
+                              time_period: str = "Recent Period") -> Dict[str, str]:
+        """
+        Format summarization prompt as separate system/user messages
+
+        Args:
+            complaints_data: Formatted complaint data string
+            summary_type: Type of summary requested
+            time_period: Time period being analyzed
+
+        Returns:
+            Dict with 'system' and 'user' message strings
+        """
         try:
-            formatted = self.template.format(
+            user_message = self._user_template.format(
                 complaints_data=complaints_data,
                 summary_type=summary_type,
                 time_period=time_period
             )
-            
+
             logger.debug("Summary prompt formatted",
                         summary_type=summary_type,
                         data_length=len(complaints_data),
-                        prompt_length=len(formatted))
-            
-            return formatted
-            
+                        prompt_length=len(user_message))
+
+            return {'system': self._static_system, 'user': user_message}
+
         except Exception as e:
             logger.error("Failed to format summary prompt",
                         summary_type=summary_type,
@@ -309,7 +586,21 @@ Format your response clearly with bullet points and specific data points where a
             raise
 
 
-# Template instances for easy access
-complaint_analysis_template = ComplaintAnalysisTemplate()
-question_answering_template = QuestionAnsweringTemplate()
-summarization_template = SummarizationTemplate()
\ No newline at end of file
+# Lazy template accessors: nothing is constructed (or logged) at
+# import, so processes that never touch a template pay no cost
+@functools.cache
+def get_complaint_analysis_template() -> ComplaintAnalysisTemplate:
+    """Get the shared complaint analysis template (built on first use)"""
+    return ComplaintAnalysisTemplate()
+
+
+@functools.cache
+def get_question_answering_template() -> QuestionAnsweringTemplate:
+    """Get the shared Q&A template (built on first use)"""
+    return QuestionAnsweringTemplate()
+
+
+@functools.cache
+def get_summarization_template() -> SummarizationTemplate:
+    """Get the shared summarization template (built on first use)"""
+    return SummarizationTemplate()
\ No newline at end of file
@@ -8,12 +8,51 @@ Educational Focus:
 - Chunking strategies for large documents
 """
 
+import asyncio
+import functools
 import json
-from typing import List, Dict, Any, Optional, Iterator
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Iterator, AsyncIterator
 from langchain.schema import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 import structlog
 
+# Token-aware splitting keeps chunks aligned with what the embedding
+# model actually sees; fall back to character slicing if tiktoken is
+# not installed
+try:
+    import tiktoken  # noqa: F401 - probe for the tokenizer backend
+    from langchain.text_splitter import TokenTextSplitter
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Polars runs the bulk content formatting over Arrow columns in Rust;
+# the per-row Python path remains the default when it is not installed
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# orjson parses the analysis JSON blobs from Postgres several times
+# faster than stdlib json; fall back transparently if unavailable
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# pysimdjson lazily projects individual fields out of a raw payload
+# without inflating the whole document into Python dicts
+try:
+    import simdjson
+    _SIMDJSON_PARSER = simdjson.Parser()
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
 import sys
 import os
 # Add the parent directory to the path so we can import config
@@ -22,6 +61,124 @@ from config import config
 
 logger = structlog.get_logger(__name__)
 
+# Formatted complaint content is a bounded set of labeled lines and in
+# practice never gets near this size; chunk sizes above it mean the
+# splitter would never fire, so it is not even built
+_MAX_EXPECTED_COMPLAINT_LEN = 2048
+
+# Shared sentinel for "no analysis": uniform .get() calls against it
+# return None, so the builders need neither an isinstance check nor a
+# branch before each analysis field. Non-dict analysis values are a
+# normalization-boundary problem, not a per-render one.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Database column -> normalized complaint key mapping used to generate
+# the row normalizers below
+_DB_COLUMN_MAP = (
+    ('id', 'id'),
+    ('complaint_number', 'complaint_number'),
+    ('type', 'complaint_type'),
+    ('description', 'descriptor'),
+    ('agency', 'agency'),
+    ('agency_name', 'agency_name'),
+    ('borough', 'borough'),
+    ('city', 'city'),
+    ('address', 'incident_address'),
+    ('incident_zip', 'incident_zip'),
+    ('latitude', 'latitude'),
+    ('longitude', 'longitude'),
+    ('status', 'status'),
+    ('priority', 'priority'),
+    ('submitted_at', 'submitted_at'),
+    ('resolved_at', 'resolved_at'),
+)
+
+
+class _FastDoc:
+    """
+    Slotted stand-in for langchain's Document during bulk loads
+
+    A pydantic Document carries a per-instance __dict__ and validation
+    machinery costing a few hundred bytes per object — real money at a
+    million complaints. This duck-types for every consumer that only
+    reads .page_content / .metadata; convert with
+    to_langchain_documents() at the vector-store boundary if a real
+    Document is required.
+    """
+
+    __slots__ = ('page_content', 'metadata')
+
+    def __init__(self, page_content: str, metadata: Dict[str, Any]):
+        self.page_content = page_content
+        self.metadata = metadata
+
+
+def to_langchain_documents(docs) -> List[Document]:
+    """Bulk-convert _FastDoc instances to langchain Documents"""
+    return [
+        Document(page_content=doc.page_content, metadata=doc.metadata)
+        if isinstance(doc, _FastDoc) else doc
+        for doc in docs
+    ]
+
+
+# The only payload fields the document builder actually consumes; raw
+# API responses carry dozens more that never need to be materialized
+_RAW_JSON_FIELDS = (
+    'id', 'complaint_number', 'type', 'description', 'borough',
+    'address', 'agency', 'agency_name', 'city', 'incident_zip',
+    'category', 'status', 'priority', 'submitted_at', 'resolved_at',
+    'latitude', 'longitude', 'analysis'
+)
+
+
+def _decode_tags(tags: Any, complaint_id: Any) -> Any:
+    """Decode a JSON-encoded tags column, logging on bad payloads"""
+    if isinstance(tags, (str, bytes)):
+        try:
+            return _json_loads(tags)
+        except ValueError:
+            logger.warning("Failed to decode analysis tags",
+                           complaint_id=complaint_id)
+            return None
+    return tags
+
+
+def _compile_normalizer(with_analysis: bool):
+    """
+    Generate a specialized row normalizer at import time
+
+    The SQL column set is fixed by the query, so the column mapping is
+    partial-evaluated into one dict literal (a single BUILD_MAP) and
+    whether analysis JOIN columns exist becomes a compile-time constant
+    instead of a per-row scan of the keys.
+    """
+    entries = ", ".join(f"'{key}': get('{column}')"
+                        for key, column in _DB_COLUMN_MAP)
+    src = (
+        "def _normalize(result):\n"
+        "    get = result.get\n"
+        f"    normalized = {{{entries}}}\n"
+    )
+    if with_analysis:
+        src += (
+            "    normalized['analysis'] = {\n"
+            "        'risk_score': get('analysis_risk_score'),\n"
+            "        'category': get('analysis_category'),\n"
+            "        'summary': get('analysis_summary'),\n"
+            "        'tags': _decode_tags(get('analysis_tags'), get('id'))\n"
+            "    }\n"
+        )
+    src += "    return {k: v for k, v in normalized.items() if v is not None}\n"
+
+    namespace = {'_decode_tags': _decode_tags}
+    exec(src, namespace)
+    return namespace['_normalize']
+
+
+_NORMALIZE_PLAIN = _compile_normalizer(with_analysis=False)
+_NORMALIZE_WITH_ANALYSIS = _compile_normalizer(with_analysis=True)
+
 
 class ComplaintDocumentLoader:
     """
@@ -39,6 +196,13 @@ class ComplaintDocumentLoader:
     - Text preprocessing and chunking concepts
     """
     
+    # Constant metadata shared by every document; the read-only proxy
+    # makes accidental mutation of the shared portion impossible
+    _BASE_METADATA = MappingProxyType({
+        'document_type': 'complaint',
+        'source': 'nyc_311'
+    })
+
     def __init__(self, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None):
         """
         Initialize document loader
@@ -50,46 +214,154 @@ class ComplaintDocumentLoader:
         self.chunk_size = chunk_size or config.RAG_CHUNK_SIZE
         self.chunk_overlap = chunk_overlap or config.RAG_CHUNK_OVERLAP
         
-        # Initialize text splitter for chunking
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", ". ", " ", ""]
-        )
+        # Initialize text splitter for chunking; skipped entirely when the
+        # chunk size exceeds any realistic complaint length, since the
+        # splitter could never fire. When available, tiktoken's
+        # cl100k_base encoding (Rust-backed, same tokenizer the OpenAI
+        # embedding models use) splits on token boundaries; otherwise
+        # the character-based fast path in _split_fast takes over.
+        self.text_splitter = None
+        if self.chunk_size <= _MAX_EXPECTED_COMPLAINT_LEN and TIKTOKEN_AVAILABLE:
+            self.text_splitter = TokenTextSplitter(
+                encoding_name="cl100k_base",
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_overlap
+            )
         
         logger.info("ComplaintDocumentLoader initialized",
                    chunk_size=self.chunk_size,
                    chunk_overlap=self.chunk_overlap)
     
-    def load_complaint_as_document(self, complaint_data: Dict[str, Any]) -> Document:
+    def load_complaint_as_document(self, complaint_data: Dict[str, Any],
+                                   legacy: bool = False) -> Document:
         """
         Convert single complaint to LangChain Document
-        
+
         Args:
             complaint_data: Dictionary containing complaint information
-            
+            legacy: Return a full pydantic Document instead of the
+                slotted fast document (for callers that need one)
+
         Returns:
-            LangChain Document with content and metadata
+            Document (slotted by default) with content and metadata
         """
-        # Create structured text content
-        content = self._format_complaint_content(complaint_data)
-        
-        # Create comprehensive metadata
-        metadata = self._create_complaint_metadata(complaint_data)
-        
-        # Create Document
-        document = Document(
-            page_content=content,
-            metadata=metadata
-        )
-        
+        document = self._build_doc(complaint_data)
+        if legacy:
+            document = Document(page_content=document.page_content,
+                                metadata=document.metadata)
+
         logger.debug("Complaint converted to document",
                     complaint_id=complaint_data.get('id'),
-                    content_length=len(content),
-                    metadata_keys=list(metadata.keys()))
-        
+                    content_length=len(document.page_content),
+                    metadata_keys=list(document.metadata.keys()))
+
         return document
+
+    def _build_doc(self, complaint: Dict[str, Any]) -> Document:
+        """
+        Build content and metadata for a complaint in one fused pass
+
+        Bulk-load hot path: each field is read from the dict exactly
+        once and feeds both the page content and the metadata, instead
+        of the content formatter and metadata builder each re-walking
+        the dict with their own .get() calls.
+
+        Deliberately plain CPython: this path is string- and
+        dict-shaped, where numba's JIT regresses rather than helps
+        (string processing falls back to object mode). The build-a-list
+        then str.join pattern below already runs the concatenation in C,
+        so do not decorate this or the legacy formatters with @njit.
+        """
+        get = complaint.get
+        intern = sys.intern
+
+        # Low-cardinality columns (a handful of boroughs, agencies,
+        # statuses) repeat the same values across every document;
+        # interning makes all copies share one str object, saving
+        # ~50 bytes of object header per field per document on bulk
+        # loads. High-cardinality fields (address, description, ids)
+        # must stay un-interned or the intern table grows unbounded.
+        complaint_type = intern(get('type') or '')
+        description = get('description', '')
+        borough = intern(get('borough') or '')
+        address = get('address', '')
+        agency = intern(get('agency') or '')
+        agency_name = intern(get('agency_name') or '')
+        status = intern(get('status') or '')
+        priority = intern(get('priority') or '')
+        submitted_at = get('submitted_at', '')
+        resolved_at = get('resolved_at', '')
+        analysis = get('analysis') or _EMPTY
+        latitude = get('latitude')
+        longitude = get('longitude')
+
+        # Structured text content
+        content_parts = [
+            f"COMPLAINT TYPE: {complaint_type or 'Unknown Type'}",
+            f"DESCRIPTION: {description or 'No description provided'}",
+            f"LOCATION: {borough or 'Unknown Borough'}, {address or 'Address not specified'}",
+            f"RESPONSIBLE AGENCY: {agency or 'Unknown Agency'}"
+            + (f" ({agency_name})" if agency_name else ""),
+            f"STATUS: {status or 'Unknown Status'}",
+            f"SUBMITTED: {submitted_at or 'Unknown submission time'}"
+        ]
+
+        # Uniform .get calls against the _EMPTY sentinel mean no
+        # isinstance dispatch or guard branch per analysis field
+        has_analysis = analysis is not _EMPTY
+        risk_score = analysis.get('risk_score')
+        category = analysis.get('category')
+        summary = analysis.get('summary')
+
+        if risk_score is not None:
+            content_parts.append(f"RISK SCORE: {risk_score}")
+        if category:
+            content_parts.append(f"CATEGORY: {category}")
+        if summary:
+            content_parts.append(f"ANALYSIS: {summary}")
+
+        if priority:
+            content_parts.append(f"PRIORITY: {priority}")
+        if resolved_at:
+            content_parts.append(f"RESOLVED: {resolved_at}")
+
+        # Comprehensive metadata as a single literal. Every value uses
+        # an empty-string sentinel instead of None, so no trailing
+        # None-stripping pass is needed
+        metadata = {
+            **self._BASE_METADATA,
+            'complaint_id': str(get('id') or ''),
+            'complaint_number': str(get('complaint_number') or ''),
+            'complaint_type': complaint_type,
+            'category': intern(get('category') or ''),
+            'agency': agency,
+            'agency_name': agency_name,
+            'borough': borough,
+            'city': get('city') or '',
+            'address': address or '',
+            'zip_code': get('incident_zip') or '',
+            'status': status,
+            'priority': priority,
+            'submitted_at': submitted_at or '',
+            'resolved_at': resolved_at or '',
+            'has_coordinates': bool(latitude and longitude),
+            'has_analysis': has_analysis
+        }
+
+        if latitude and longitude:
+            metadata['latitude'] = float(latitude)
+            metadata['longitude'] = float(longitude)
+
+        if has_analysis:
+            metadata['analysis_category'] = category or ''
+            if risk_score is not None:
+                metadata['risk_score'] = risk_score
+                metadata['risk_level'] = config.get_risk_level(risk_score)
+
+        return _FastDoc(
+            page_content="\n".join(content_parts),
+            metadata=metadata
+        )
     
     def load_complaints_as_documents(self, complaints: List[Dict[str, Any]]) -> List[Document]:
         """
@@ -106,17 +378,22 @@ class ComplaintDocumentLoader:
         
         logger.info("Loading complaints as documents",
                    complaint_count=len(complaints))
-        
-        documents = []
-        for complaint in complaints:
-            try:
-                document = self.load_complaint_as_document(complaint)
-                documents.append(document)
-            except Exception as e:
-                logger.error("Failed to convert complaint to document",
-                           complaint_id=complaint.get('id'),
-                           error=str(e))
-        
+
+        try:
+            # Fast path: one comprehension, no per-item handler setup
+            documents = [self._build_doc(complaint) for complaint in complaints]
+        except Exception:
+            # A bad row aborts the batch; redo item-by-item so the
+            # failures are isolated and reported without losing the rest
+            documents = []
+            for complaint in complaints:
+                try:
+                    documents.append(self._build_doc(complaint))
+                except Exception as e:
+                    logger.error("Failed to convert complaint to document",
+                               complaint_id=complaint.get('id'),
+                               error=str(e))
+
         logger.info("Complaints loaded as documents",
                    input_count=len(complaints),
                    output_count=len(documents))
@@ -143,34 +420,112 @@ class ComplaintDocumentLoader:
         # Split documents into chunks
         chunked_documents = []
         for doc in documents:
-            # Check if document needs chunking
-            if len(doc.page_content) > self.chunk_size:
-                chunks = self.text_splitter.split_documents([doc])
-                
-                # Add chunk metadata
-                for i, chunk in enumerate(chunks):
-                    chunk.metadata.update({
-                        'chunk_index': i,
-                        'total_chunks': len(chunks),
-                        'is_chunked': True
-                    })
-                
-                chunked_documents.extend(chunks)
-                
-                logger.debug("Document chunked",
-                           original_length=len(doc.page_content),
-                           chunk_count=len(chunks))
-            else:
-                # Keep original document
-                doc.metadata['is_chunked'] = False
-                chunked_documents.append(doc)
-        
+            chunked_documents.extend(self._chunk_document(doc))
+
         logger.info("Document chunking completed",
                    input_documents=len(documents),
                    output_chunks=len(chunked_documents))
         
         return chunked_documents
-    
+
+    def _chunk_document(self, doc: Document) -> List[Document]:
+        """Split a single document into chunks if it exceeds chunk_size"""
+        if len(doc.page_content) <= self.chunk_size:
+            doc.metadata['is_chunked'] = False
+            return [doc]
+
+        if self.text_splitter is not None:
+            chunks = self.text_splitter.split_documents([doc])
+        else:
+            # Preserve the incoming document class (slotted or pydantic)
+            doc_cls = doc.__class__
+            chunks = [
+                doc_cls(page_content=piece, metadata=dict(doc.metadata))
+                for piece in self._split_fast(doc.page_content)
+            ]
+
+        # Add chunk metadata with direct keyed assignment; .update()
+        # would allocate and re-hash a temp dict per chunk
+        total_chunks = len(chunks)
+        for i, chunk in enumerate(chunks):
+            m = chunk.metadata
+            m['chunk_index'] = i
+            m['total_chunks'] = total_chunks
+            m['is_chunked'] = True
+
+        logger.debug("Document chunked",
+                   original_length=len(doc.page_content),
+                   chunk_count=len(chunks))
+
+        return chunks
+
+    async def iter_chunks_async(self, complaints: List[Dict[str, Any]],
+                                batch_size: int = 128) -> "AsyncIterator[List[Document]]":
+        """
+        Yield chunked documents in embedding-sized batches
+
+        Educational Focus:
+        - Producer/consumer batching for embedding ingest
+        - Continuous batching: modern inference engines coalesce many
+          inputs per call, so the producer should hand over full
+          batches rather than single documents
+
+        Each yielded list holds up to batch_size chunks, sized so the
+        consumer can pass it straight to an embeddings call with list
+        input and amortize the per-request HTTP overhead. Control is
+        yielded between batches so the consumer's network I/O can
+        overlap with formatting the next batch.
+        """
+        batch: List[Document] = []
+
+        for complaint in complaints:
+            try:
+                doc = self._build_doc(complaint)
+            except Exception as e:
+                logger.error("Failed to convert complaint to document",
+                           complaint_id=complaint.get('id'),
+                           error=str(e))
+                continue
+
+            batch.extend(self._chunk_document(doc))
+
+            while len(batch) >= batch_size:
+                logger.debug("Yielding chunk batch",
+                           batch_size=batch_size,
+                           backlog=len(batch) - batch_size)
+                yield batch[:batch_size]
+                batch = batch[batch_size:]
+                # Let the consumer's pending I/O run before producing more
+                await asyncio.sleep(0)
+
+        if batch:
+            yield batch
+
+    def _split_fast(self, text: str) -> Iterator[str]:
+        """
+        Split oversize text on newline boundaries with str.rfind slicing
+
+        Complaint content is newline-delimited labeled lines, so a
+        backwards scan for the last newline inside each window gives
+        the same line-aligned chunks as the recursive splitter without
+        its separator cascade and per-chunk length bookkeeping.
+        """
+        length = len(text)
+        i = 0
+        while i < length:
+            end = i + self.chunk_size
+            if end >= length:
+                yield text[i:]
+                return
+
+            j = text.rfind("\n", i, end)
+            if j <= i:
+                # No newline in the window; hard-split at the limit
+                j = end
+
+            yield text[i:j]
+            i = max(j - self.chunk_overlap, i + 1)
+
     def _format_complaint_content(self, complaint: Dict[str, Any]) -> str:
         """
         Format complaint data into structured text content
@@ -207,19 +562,17 @@ class ComplaintDocumentLoader:
         ]
         
         # Add analysis information if available
-        if 'analysis' in complaint:
-            analysis = complaint['analysis']
-            if isinstance(analysis, dict):
-                risk_score = analysis.get('risk_score')
-                category = analysis.get('category')
-                summary = analysis.get('summary')
-                
-                if risk_score is not None:
-                    content_parts.append(f"RISK SCORE: {risk_score}")
-                if category:
-                    content_parts.append(f"CATEGORY: {category}")
-                if summary:
-                    content_parts.append(f"ANALYSIS: {summary}")
+        analysis = complaint.get('analysis') or _EMPTY
+        risk_score = analysis.get('risk_score')
+        category = analysis.get('category')
+        summary = analysis.get('summary')
+
+        if risk_score is not None:
+            content_parts.append(f"RISK SCORE: {risk_score}")
+        if category:
+            content_parts.append(f"CATEGORY: {category}")
+        if summary:
+            content_parts.append(f"ANALYSIS: {summary}")
         
         # Add additional fields if present
         if complaint.get('priority'):
@@ -283,14 +636,14 @@ class ComplaintDocumentLoader:
             metadata['has_coordinates'] = False
         
         # Add analysis metadata if available
-        if 'analysis' in complaint and isinstance(complaint['analysis'], dict):
-            analysis = complaint['analysis']
+        analysis = complaint.get('analysis') or _EMPTY
+        if analysis is not _EMPTY:
             metadata.update({
                 'risk_score': analysis.get('risk_score'),
                 'analysis_category': analysis.get('category', ''),
                 'has_analysis': True
             })
-            
+
             # Add risk level classification
             risk_score = analysis.get('risk_score')
             if risk_score is not None:
@@ -303,40 +656,172 @@ class ComplaintDocumentLoader:
         
         return cleaned_metadata
     
-    def load_from_database_result(self, db_results: List[Dict[str, Any]]) -> List[Document]:
+    def load_from_raw_json(self, raw: bytes) -> Document:
         """
-        Load documents from database query results
-        
+        Build a document straight from a raw JSON payload
+
         Educational Focus:
-        - Database integration patterns
-        - Result set processing
-        - Error handling for real data
+        - Lazy field projection: API responses carry far more fields
+          than the document builder reads, so with pysimdjson only the
+          ~18 consumed keys are materialized into Python objects and
+          the rest of the payload is never inflated
+        - Graceful degradation to a full decode when the accelerated
+          parser is absent
+
+        Args:
+            raw: JSON-encoded complaint payload bytes
+
+        Returns:
+            LangChain Document for the complaint
         """
-        if not db_results:
+        if not SIMDJSON_AVAILABLE:
+            return self.load_complaint_as_document(_json_loads(raw))
+
+        parsed = _SIMDJSON_PARSER.parse(raw)
+
+        complaint = {}
+        for key in _RAW_JSON_FIELDS:
+            try:
+                complaint[key] = parsed[key]
+            except KeyError:
+                continue
+
+        # The nested analysis object must be a real dict for _build_doc
+        analysis = complaint.get('analysis')
+        if analysis is not None and not isinstance(analysis, dict):
+            complaint['analysis'] = analysis.as_dict()
+
+        return self._build_doc(complaint)
+
+    def load_from_dataframe(self, df: "pl.DataFrame") -> List[Document]:
+        """
+        Bulk-convert a Polars DataFrame of complaints to documents
+
+        Educational Focus:
+        - AoS vs SoA: columnar (structure-of-arrays) layouts let the
+          row-independent content formatting run as one vectorized
+          Rust string kernel instead of a per-row Python loop
+        - Keeping a per-row fallback for single-document callers
+
+        The fixed six-line core of the page content is composed column
+        wise with pl.format; the optional analysis/priority/resolved
+        lines and the metadata dict are still built per row since they
+        are conditional and cheap.
+        """
+        if not POLARS_AVAILABLE:
+            raise ImportError("polars is required for load_from_dataframe; "
+                              "use load_complaints_as_documents instead")
+
+        if df.is_empty():
             return []
-        
-        logger.info("Loading documents from database results",
-                   result_count=len(db_results))
-        
+
+        logger.info("Loading complaints from dataframe",
+                   complaint_count=df.height)
+
+        filled = df.with_columns(
+            pl.col('type').fill_null('Unknown Type'),
+            pl.col('description').fill_null('No description provided'),
+            pl.col('borough').fill_null('Unknown Borough'),
+            pl.col('address').fill_null('Address not specified'),
+            pl.col('agency').fill_null('Unknown Agency'),
+            pl.col('status').fill_null('Unknown Status'),
+            pl.col('submitted_at').fill_null('Unknown submission time')
+        )
+
+        contents = filled.select(
+            pl.format(
+                "COMPLAINT TYPE: {}\nDESCRIPTION: {}\nLOCATION: {}, {}\n"
+                "RESPONSIBLE AGENCY: {}\nSTATUS: {}\nSUBMITTED: {}",
+                pl.col('type'), pl.col('description'),
+                pl.col('borough'), pl.col('address'),
+                pl.col('agency'), pl.col('status'),
+                pl.col('submitted_at')
+            )
+        ).to_series().to_list()
+
         documents = []
+        for content, row in zip(contents, df.iter_rows(named=True)):
+            agency_name = row.get('agency_name')
+            if agency_name:
+                # Match the per-row formatter's parenthesized agency name
+                content = content.replace(
+                    "\nSTATUS:", f" ({agency_name})\nSTATUS:", 1)
+
+            # Analysis lines in the same order as _build_doc, so page
+            # content (and therefore hashes and embeddings) matches the
+            # per-row path for analyzed complaints
+            analysis = row.get('analysis') or _EMPTY
+            risk_score = analysis.get('risk_score')
+            if risk_score is not None:
+                content += f"\nRISK SCORE: {risk_score}"
+            category = analysis.get('category')
+            if category:
+                content += f"\nCATEGORY: {category}"
+            summary = analysis.get('summary')
+            if summary:
+                content += f"\nANALYSIS: {summary}"
+
+            priority = row.get('priority')
+            if priority:
+                content += f"\nPRIORITY: {priority}"
+            resolved_at = row.get('resolved_at')
+            if resolved_at:
+                content += f"\nRESOLVED: {resolved_at}"
+
+            documents.append(_FastDoc(
+                page_content=content,
+                metadata=self._create_complaint_metadata(row)
+            ))
+
+        logger.info("Dataframe loaded as documents",
+                   output_count=len(documents))
+
+        return documents
+
+    def iter_documents_from_db(self, db_results: List[Dict[str, Any]]) -> Iterator[Document]:
+        """
+        Stream documents from database query results
+
+        Educational Focus:
+        - Database integration patterns
+        - Generator-based result set processing
+        - Error handling for real data
+
+        Yielding one Document at a time keeps peak memory proportional
+        to the consumer's batch size rather than the full result set,
+        which matters on million-row backfills.
+        """
         for result in db_results:
             try:
                 # Convert database result to complaint format
                 complaint_data = self._normalize_db_result(result)
-                
-                # Create document
-                document = self.load_complaint_as_document(complaint_data)
-                documents.append(document)
-                
+
+                yield self.load_complaint_as_document(complaint_data)
+
             except Exception as e:
                 logger.error("Failed to process database result",
                            result=result,
                            error=str(e))
-        
+
+    def load_from_database_result(self, db_results: List[Dict[str, Any]]) -> List[Document]:
+        """
+        Load documents from database query results as a list
+
+        Back-compat wrapper around iter_documents_from_db() for callers
+        that need the fully materialized list.
+        """
+        if not db_results:
+            return []
+
+        logger.info("Loading documents from database results",
+                   result_count=len(db_results))
+
+        documents = list(self.iter_documents_from_db(db_results))
+
         logger.info("Documents loaded from database",
                    input_results=len(db_results),
                    output_documents=len(documents))
-        
+
         return documents
     
     def _normalize_db_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
@@ -344,70 +829,52 @@ class ComplaintDocumentLoader:
         Normalize database result to standard complaint format
         
         This handles differences between database column names
-        and the expected complaint data format
+        and the expected complaint data format. The actual mapping runs
+        in one of two normalizers generated at import time from
+        _DB_COLUMN_MAP, specialized on whether the SELECT included the
+        analysis JOIN columns.
         """
-        # Map database columns to expected format
-        normalized = {
-            'id': result.get('id'),
-            'complaint_number': result.get('complaint_number'),
-            'type': result.get('complaint_type'),
-            'description': result.get('descriptor'),
-            'agency': result.get('agency'),
-            'agency_name': result.get('agency_name'),
-            'borough': result.get('borough'),
-            'city': result.get('city'),
-            'address': result.get('incident_address'),
-            'incident_zip': result.get('incident_zip'),
-            'latitude': result.get('latitude'),
-            'longitude': result.get('longitude'),
-            'status': result.get('status'),
-            'priority': result.get('priority'),
-            'submitted_at': result.get('submitted_at'),
-            'resolved_at': result.get('resolved_at')
-        }
-        
-        # Add analysis data if present (from JOIN)
-        if any(key.startswith('analysis_') for key in result.keys()):
-            normalized['analysis'] = {
-                'risk_score': result.get('analysis_risk_score'),
-                'category': result.get('analysis_category'),
-                'summary': result.get('analysis_summary'),
-                'tags': result.get('analysis_tags')
-            }
-        
-        # Clean up None values
-        cleaned = {k: v for k, v in normalized.items() if v is not None}
-        
-        return cleaned
+        # The JOIN always selects these columns together, so one hash
+        # probe replaces the O(n_cols) startswith scan per row
+        if 'analysis_risk_score' in result or 'analysis_category' in result:
+            return _NORMALIZE_WITH_ANALYSIS(result)
+        return _NORMALIZE_PLAIN(result)
     
-    def get_document_stats(self, documents: List[Document]) -> Dict[str, Any]:
-        """Get statistics about loaded documents"""
-        if not documents:
-            return {'total_documents': 0}
-        
-        # Basic stats
-        total_docs = len(documents)
-        total_content_length = sum(len(doc.page_content) for doc in documents)
-        avg_content_length = total_content_length / total_docs if total_docs > 0 else 0
-        
-        # Metadata analysis
-        boroughs = set()
-        agencies = set()
-        complaint_types = set()
+    def get_document_stats(self, documents: Iterator[Document]) -> Dict[str, Any]:
+        """
+        Get statistics about loaded documents
+
+        Accepts any iterable (including the generator from
+        iter_documents_from_db) and folds everything in a single pass,
+        so stats over a stream never require materializing it.
+        """
+        # Fold all stats in one traversal. Bound methods are hoisted out
+        # of the loop so the hot path is pure local-variable access
+        total_docs = 0
+        total_content_length = 0
         chunked_docs = 0
-        
+        boroughs, agencies, complaint_types = set(), set(), set()
+        b_add, a_add, t_add = boroughs.add, agencies.add, complaint_types.add
+
         for doc in documents:
-            metadata = doc.metadata
-            
-            if metadata.get('borough'):
-                boroughs.add(metadata['borough'])
-            if metadata.get('agency'):
-                agencies.add(metadata['agency'])
-            if metadata.get('complaint_type'):
-                complaint_types.add(metadata['complaint_type'])
-            if metadata.get('is_chunked'):
+            total_docs += 1
+            total_content_length += len(doc.page_content)
+            m = doc.metadata
+
+            if m.get('borough'):
+                b_add(m['borough'])
+            if m.get('agency'):
+                a_add(m['agency'])
+            if m.get('complaint_type'):
+                t_add(m['complaint_type'])
+            if m.get('is_chunked'):
                 chunked_docs += 1
-        
+
+        if not total_docs:
+            return {'total_documents': 0}
+
+        avg_content_length = total_content_length / total_docs
+
         return {
             'total_documents': total_docs,
             'total_content_length': total_content_length,
@@ -422,5 +889,9 @@ class ComplaintDocumentLoader:
         }
 
 
-# Global document loader instance
-complaint_document_loader = ComplaintDocumentLoader()
\ No newline at end of file
+# Lazy accessor for the shared loader; importing this module no longer
+# constructs (or logs from) a loader nobody may use
+@functools.cache
+def get_complaint_document_loader() -> ComplaintDocumentLoader:
+    """Get the shared document loader (built on first use)"""
+    return ComplaintDocumentLoader()
\ No newline at end of file
@@ -9,21 +9,78 @@ Educational Focus:
 - Laravel-Python data synchronization
 """
 
+import asyncio
+import functools
 import os
 import json
 import hashlib
+import queue
+import struct
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
 from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import quote_plus
 import numpy as np
 import structlog
 
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    from psycopg2.extras import (RealDictCursor, register_default_json,
+                                 register_default_jsonb)
+    from psycopg2.pool import ThreadedConnectionPool
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
     psycopg2 = None
 
+# orjson decodes the metadata JSON column several times faster than
+# stdlib json; registered as the driver-level loads below
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(value: Any) -> bytes:
+        # OPT_SERIALIZE_NUMPY lets numpy scalars in metadata serialize
+        # without a Python-side conversion pass
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(value: Any) -> bytes:
+        return json.dumps(value).encode('utf-8')
+
+    ORJSON_AVAILABLE = False
+
+# asyncpg provides a native async COPY path so embedding API calls and
+# database writes can overlap
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
+# BLAKE3 hashes prompt-sized strings ~5x faster than SHA-256 and its
+# Rust extension releases the GIL, so bulk hashing scales with cores
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# register_vector lets %s bind a numpy array straight into a vector
+# parameter, skipping text serialization/parsing of 1536 floats
+try:
+    from pgvector.psycopg2 import register_vector
+    PGVECTOR_ADAPTER_AVAILABLE = True
+except ImportError:
+    PGVECTOR_ADAPTER_AVAILABLE = False
+
 try:
     from langchain_community.vectorstores.pgvector import PGVector
     from langchain.schema import Document
@@ -42,6 +99,76 @@ from rag.document_loader import ComplaintDocumentLoader
 
 logger = structlog.get_logger(__name__)
 
+# PGCOPY binary protocol pieces: fixed signature + flags/extension
+# words, and the -1 field-count trailer that ends the stream
+_PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_PGCOPY_TRAILER = struct.pack('!h', -1)
+_PG_NULL = struct.pack('!i', -1)
+
+# Microseconds between the Unix and Postgres (2000-01-01) epochs
+_PG_EPOCH_OFFSET_US = 946_684_800 * 1_000_000
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_query_embedding(generator, query: str, model: str) -> Tuple[float, ...]:
+    """
+    Memoize query embeddings keyed by (query text, model)
+
+    Identical questions are common (retries, pagination, UI repeats)
+    and each one is otherwise a full embedding API round-trip. The
+    tuple return keeps cached values immutable.
+    """
+    return tuple(generator.embed_user_question(query))
+
+
+def _content_hash(content: str) -> str:
+    """
+    Hash document content for deduplication (64 hex chars)
+
+    Uses BLAKE3 when installed, falling back to SHA-256. The two never
+    collide into false duplicates; a changed algorithm just means a
+    one-time re-embed of unmatched rows.
+    """
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3(content.encode()).hexdigest(length=32)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _pg_text(value: str) -> bytes:
+    """Serialize a text field for COPY BINARY (int32 length + bytes)"""
+    raw = value.encode('utf-8')
+    return struct.pack('!i', len(raw)) + raw
+
+
+def _pg_int4(value: int) -> bytes:
+    """Serialize an integer field for COPY BINARY"""
+    return struct.pack('!ii', 4, value)
+
+
+def _pg_int8(value: int) -> bytes:
+    """Serialize a bigint field for COPY BINARY"""
+    return struct.pack('!iq', 8, value)
+
+
+def _pg_jsonb(value: Dict[str, Any]) -> bytes:
+    """Serialize a jsonb field for COPY BINARY (1-byte version + JSON)"""
+    raw = b'\x01' + _json_dumps_bytes(value)
+    return struct.pack('!i', len(raw)) + raw
+
+
+def _pg_timestamp(unix_seconds: float) -> bytes:
+    """Serialize a timestamp field (microseconds since 2000-01-01)"""
+    micros = int(unix_seconds * 1_000_000) - _PG_EPOCH_OFFSET_US
+    return struct.pack('!iq', 8, micros)
+
+
+def _pg_vector(embedding: List[float]) -> bytes:
+    """Serialize a pgvector field (int16 dim, int16 unused, float32s)"""
+    # One big-endian cast + memcpy instead of per-float struct packing
+    arr = np.asarray(embedding, dtype=np.float32)
+    raw = struct.pack('!HH', arr.size, 0) + arr.astype('>f4').tobytes()
+    return struct.pack('!i', len(raw)) + raw
+
 
 class PGVectorStoreManager:
     """
@@ -64,14 +191,57 @@ class PGVectorStoreManager:
     def __init__(self):
         self.embedding_generator = EmbeddingGenerator()
         self.connection_params = self._get_connection_params()
+        self._dsn = self._build_dsn(self.connection_params)
         self.vector_store = None
-        
+        self._pool = None
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
+
         # Test connection on initialization
         if not self._test_connection():
             raise ConnectionError("Failed to connect to PostgreSQL with pgvector")
-            
+
         logger.info("PGVectorStoreManager initialized successfully")
 
+    @contextmanager
+    def _conn(self):
+        """
+        Check a pooled connection out for the duration of a block
+
+        Pooling keeps connections warm between calls, so the TCP +
+        auth + startup round-trips happen maxconn times per process
+        instead of once per query, and server-side prepared statements
+        survive across calls. Rolls back on exception before returning
+        the connection to the pool.
+        """
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(
+                minconn=1, maxconn=16, **self.connection_params
+            )
+
+        conn = self._pool.getconn()
+        # Register adapters once per pooled connection: pgvector so numpy
+        # arrays bind as binary vector parameters everywhere, and orjson
+        # as the json/jsonb decoder so metadata columns arrive as dicts
+        # without a second parse in Python
+        if not getattr(conn, '_adapters_registered', False):
+            if PGVECTOR_ADAPTER_AVAILABLE:
+                register_vector(conn)
+            register_default_json(conn, loads=_json_loads)
+            register_default_jsonb(conn, loads=_json_loads)
+            conn._adapters_registered = True
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            # PREPARE is transactional: the rollback deallocated any
+            # statement prepared in this transaction, so the flag must
+            # not outlive it
+            conn._search_prepared = False
+            raise
+        finally:
+            self._pool.putconn(conn)
+
     def _get_connection_params(self) -> Dict[str, str]:
         """Get PostgreSQL connection parameters from environment/config"""
         return {
@@ -82,6 +252,20 @@ class PGVectorStoreManager:
             'password': os.getenv('DB_PASSWORD', ''),
         }
 
+    @staticmethod
+    def _build_dsn(params: Dict[str, str]) -> str:
+        """
+        Build the connection URL once at startup
+
+        Credentials are percent-encoded so passwords containing '@',
+        ':' or '/' do not break the URL; every dsn consumer (LangChain
+        PGVector, asyncpg) reuses this string instead of rebuilding it.
+        """
+        user = quote_plus(params['user'])
+        password = quote_plus(params['password'])
+        return (f"postgresql://{user}:{password}@"
+                f"{params['host']}:{params['port']}/{params['database']}")
+
     def _test_connection(self) -> bool:
         """Test database connection and pgvector availability"""
         if not PSYCOPG2_AVAILABLE:
@@ -89,24 +273,23 @@ class PGVectorStoreManager:
             return False
             
         try:
-            conn = psycopg2.connect(**self.connection_params)
-            with conn.cursor() as cur:
-                # Test pgvector extension
-                cur.execute("SELECT extname FROM pg_extension WHERE extname = 'vector';")
-                result = cur.fetchone()
-                
-                if not result:
-                    logger.error("pgvector extension not installed")
-                    return False
-                    
-                # Test vector operations
-                cur.execute("SELECT '[1,2,3]'::vector <-> '[1,2,4]'::vector AS distance;")
-                distance = cur.fetchone()[0]
-                logger.info("pgvector test successful", distance=distance)
-                
-            conn.close()
+            with self._conn() as conn:
+                with conn.cursor() as cur:
+                    # Test pgvector extension
+                    cur.execute("SELECT extname FROM pg_extension WHERE extname = 'vector';")
+                    result = cur.fetchone()
+
+                    if not result:
+                        logger.error("pgvector extension not installed")
+                        return False
+
+                    # Test vector operations
+                    cur.execute("SELECT '[1,2,3]'::vector <-> '[1,2,4]'::vector AS distance;")
+                    distance = cur.fetchone()[0]
+                    logger.info("pgvector test successful", distance=distance)
+
             return True
-            
+
         except Exception as e:
             logger.error("pgvector connection test failed", error=str(e))
             return False
@@ -127,7 +310,7 @@ class PGVectorStoreManager:
             embedding = self.embedding_generator.embed_user_question(document.page_content)
             
             # Create content hash for deduplication
-            content_hash = hashlib.sha256(document.page_content.encode()).hexdigest()
+            content_hash = _content_hash(document.page_content)
             
             # Prepare metadata
             metadata = document.metadata.copy() if document.metadata else {}
@@ -137,49 +320,45 @@ class PGVectorStoreManager:
                 'content_length': len(document.page_content)
             })
             
-            conn = psycopg2.connect(**self.connection_params)
-            with conn.cursor() as cur:
-                # Check if embedding already exists
-                cur.execute("""
-                    SELECT id FROM document_embeddings 
-                    WHERE document_hash = %s
-                """, (content_hash,))
-                
-                existing = cur.fetchone()
-                if existing:
-                    logger.info("Embedding already exists", 
-                              content_hash=content_hash, 
-                              existing_id=existing[0])
-                    conn.close()
-                    return True
-                
-                # Insert new embedding record
-                cur.execute("""
-                    INSERT INTO document_embeddings 
-                    (document_type, document_id, document_hash, content, metadata, 
-                     embedding_model, embedding_dimension, embedding, created_at, updated_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-                    RETURNING id
-                """, (
-                    document_type,
-                    document_id,
-                    content_hash,
-                    document.page_content,
-                    json.dumps(metadata),
-                    config.OPENAI_EMBEDDING_MODEL,
-                    len(embedding),
-                    f"[{','.join(map(str, embedding))}]"
-                ))
-                
-                new_id = cur.fetchone()[0]
-                conn.commit()
-                
-                logger.info("Created embedding record", 
-                          embedding_id=new_id, 
-                          document_type=document_type,
-                          dimension=len(embedding))
-                
-            conn.close()
+            with self._conn() as conn:
+                with conn.cursor() as cur:
+                    # Single round-trip upsert: the unique constraint on
+                    # document_hash makes deduplication race-free under
+                    # concurrent writers, with no SELECT beforehand
+                    cur.execute("""
+                        INSERT INTO document_embeddings
+                        (document_type, document_id, document_hash, content, metadata,
+                         embedding_model, embedding_dimension, embedding, created_at, updated_at)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
+                        ON CONFLICT (document_hash) DO NOTHING
+                        RETURNING id
+                    """, (
+                        document_type,
+                        document_id,
+                        content_hash,
+                        document.page_content,
+                        _json_dumps_bytes(metadata).decode('utf-8'),
+                        config.OPENAI_EMBEDDING_MODEL,
+                        len(embedding),
+                        # Binary bind via the registered adapter; text
+                        # literal only as a fallback
+                        np.asarray(embedding, dtype=np.float32)
+                        if PGVECTOR_ADAPTER_AVAILABLE
+                        else f"[{','.join(map(str, embedding))}]"
+                    ))
+
+                    row = cur.fetchone()
+                    conn.commit()
+
+                    if row is None:
+                        logger.info("Embedding already exists",
+                                  content_hash=content_hash)
+                    else:
+                        logger.info("Created embedding record",
+                                  embedding_id=row[0],
+                                  document_type=document_type,
+                                  dimension=len(embedding))
+
             return True
             
         except Exception as e:
@@ -188,59 +367,93 @@ class PGVectorStoreManager:
                         document_type=document_type)
             return False
 
-    def search_similar_documents(self, query: str, document_type: str = None, 
-                                threshold: float = 0.7, limit: int = 10) -> List[Dict[str, Any]]:
+    # Parsed and planned once per pooled connection; the hot path only
+    # sends EXECUTE with three parameters. The OR on $2 folds away at
+    # execution when the type filter is empty.
+    _SEARCH_PREPARE = """
+        PREPARE search_documents (vector, text, int) AS
+        SELECT
+            id, document_type, document_id, content, metadata,
+            embedding_model, embedding_dimension,
+            (embedding <=> $1) as distance,
+            created_at
+        FROM document_embeddings
+        WHERE ($2 = '' OR document_type = $2)
+        ORDER BY embedding <=> $1
+        LIMIT $3
+    """
+
+    def search_similar_documents(self, query: str, document_type: str = None,
+                                threshold: float = 0.7, limit: int = 10,
+                                ef_search: int = 40) -> List[Dict[str, Any]]:
         """
         Search for similar documents using vector similarity
-        
+
         Educational Focus:
         - Vector similarity queries in PostgreSQL
-        - Cosine distance calculations
-        - Threshold filtering
+        - Index-friendly query shape: pgvector only uses an HNSW/IVF
+          index when the ORDER BY is a bare `embedding <=> $1` with no
+          arithmetic wrapper, so the threshold filter happens on the
+          returned distances in Python instead of in the WHERE clause
+        - Server-side prepared statement skips parse/plan per call
+        - hnsw.ef_search sizes the candidate queue of the HNSW
+          traversal, a direct recall/latency dial: ~100 for
+          high-recall RAG answers, ~20 for fast autocomplete
         - Result ranking and formatting
         """
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_generator.embed_user_question(query)
-            embedding_str = f"[{','.join(map(str, query_embedding))}]"
-            
-            conn = psycopg2.connect(**self.connection_params)
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Build similarity search query
-                base_query = """
-                    SELECT 
-                        id, document_type, document_id, content, metadata,
-                        embedding_model, embedding_dimension,
-                        1 - (embedding <=> %s::vector) as similarity,
-                        created_at
-                    FROM document_embeddings 
-                    WHERE 1 - (embedding <=> %s::vector) > %s
-                """
-                
-                params = [embedding_str, embedding_str, threshold]
-                
-                # Add document type filter if specified
-                if document_type:
-                    base_query += " AND document_type = %s"
-                    params.append(document_type)
-                
-                # Order by similarity and limit results
-                base_query += " ORDER BY embedding <=> %s::vector ASC LIMIT %s"
-                params.extend([embedding_str, limit])
-                
-                cur.execute(base_query, params)
+            # Generate (or recall) the query embedding before touching
+            # the database, so repeated questions skip the API entirely
+            query_embedding = _cached_query_embedding(
+                self.embedding_generator, query.strip(),
+                config.OPENAI_EMBEDDING_MODEL
+            )
+
+            with self._conn() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
+                if PGVECTOR_ADAPTER_AVAILABLE:
+                    # Adapter is registered by _conn(); bind directly
+                    query_vector = np.asarray(query_embedding, dtype=np.float32)
+                else:
+                    query_vector = f"[{','.join(map(str, query_embedding))}]"
+
+                if not getattr(conn, '_search_prepared', False):
+                    cur.execute(self._SEARCH_PREPARE)
+                    conn._search_prepared = True
+
+                # SET LOCAL scopes the knob to this transaction, so the
+                # pooled connection goes back with the server default
+                cur.execute("SET LOCAL hnsw.ef_search = %s", (ef_search,))
+
+                cur.execute(
+                    "EXECUTE search_documents (%s, %s, %s)",
+                    (query_vector, document_type or '', limit)
+                )
                 results = cur.fetchall()
-                
-                # Format results
+
+                # Commit to end the read transaction: putconn rolls
+                # back non-idle connections, and PREPARE is
+                # transactional, so without this the statement would be
+                # deallocated while conn._search_prepared stayed set —
+                # every later search on the pooled connection would
+                # fail. Committing promotes the PREPARE to session
+                # lifetime (and reverts SET LOCAL as intended)
+                conn.commit()
+
+                # Post-filter by threshold and format results
+                max_distance = 1.0 - threshold
                 formatted_results = []
                 for row in results:
+                    distance = float(row['distance'])
+                    if distance >= max_distance:
+                        continue
+
                     formatted_results.append({
                         'embedding_id': row['id'],
                         'document_type': row['document_type'],
                         'document_id': row['document_id'],
                         'content': row['content'],
-                        'similarity': float(row['similarity']),
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {},
+                        'similarity': 1.0 - distance,
+                        'metadata': row['metadata'] or {},
                         'embedding_model': row['embedding_model'],
                         'created_at': row['created_at'].isoformat() if row['created_at'] else None
                     })
@@ -249,8 +462,7 @@ class PGVectorStoreManager:
                           query_length=len(query),
                           results_count=len(formatted_results),
                           threshold=threshold)
-                
-            conn.close()
+
             return formatted_results
             
         except Exception as e:
@@ -259,55 +471,349 @@ class PGVectorStoreManager:
                         query=query[:100])
             return []
 
-    def bulk_create_embeddings(self, documents: List[Tuple[Document, str, int]], 
+    def _bulk_copy(self, conn, rows: List[Tuple]) -> None:
+        """
+        Stream embedding rows into Postgres with COPY BINARY
+
+        Educational Focus:
+        - COPY FROM STDIN does the lock/permission/type resolution once
+          for the whole stream instead of per INSERT, which is where
+          the order-of-magnitude bulk-ingest speedups come from
+        - pgvector's binary wire format (dim, unused, float32 payload)
+
+        Args:
+            conn: Open database connection (caller owns commit)
+            rows: Tuples of (document_type, document_id, content_hash,
+                  content, metadata, model, dimension, embedding)
+        """
+        now = time.time()
+        timestamp = _pg_timestamp(now)
+        field_count = struct.pack('!h', 10)
+
+        # Collect fragments and join once: a single allocation sized to
+        # the final stream, instead of BytesIO growing incrementally
+        # under ~15 KB of binary payload per row
+        parts = [_PGCOPY_HEADER]
+        append = parts.append
+
+        for doc_type, doc_id, content_hash, content, metadata, model, dimension, embedding in rows:
+            append(field_count)
+            append(_pg_text(doc_type))
+            append(_pg_int8(doc_id) if doc_id is not None else _PG_NULL)
+            append(_pg_text(content_hash))
+            append(_pg_text(content))
+            append(_pg_jsonb(metadata))
+            append(_pg_text(model))
+            append(_pg_int4(dimension))
+            append(_pg_vector(embedding))
+            append(timestamp)
+            append(timestamp)
+
+        append(_PGCOPY_TRAILER)
+        buf = BytesIO(b''.join(parts))
+
+        with conn.cursor() as cur:
+            cur.copy_expert(
+                """COPY document_embeddings
+                   (document_type, document_id, document_hash, content, metadata,
+                    embedding_model, embedding_dimension, embedding,
+                    created_at, updated_at)
+                   FROM STDIN WITH (FORMAT BINARY)""",
+                buf
+            )
+
+    def bulk_create_embeddings(self, documents: List[Tuple[Document, str, int]],
                              batch_size: int = 50) -> Dict[str, int]:
         """
         Bulk create embeddings for multiple documents
-        
+
+        The (document, type, id) tuples are unpacked into parallel
+        columns once at this boundary; everything below works on the
+        columnar layout instead of re-touching Document objects per row.
+        """
+        if not documents:
+            return {'processed': 0, 'created': 0, 'skipped': 0, 'failed': 0}
+
+        contents = [document.page_content for document, _, _ in documents]
+        doc_types = [doc_type for _, doc_type, _ in documents]
+        doc_ids = [doc_id for _, _, doc_id in documents]
+        metadatas = [document.metadata or {} for document, _, _ in documents]
+        return self._bulk_create_columnar(contents, doc_types, doc_ids, metadatas)
+
+    def _bulk_create_columnar(self, contents: List[str], doc_types: List[str],
+                              doc_ids: List[int],
+                              metadatas: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Columnar bulk ingest
+
         Educational Focus:
-        - Batch processing patterns
-        - Transaction management
-        - Progress tracking
+        - Structure-of-arrays batch layout: embeddings live in one
+          contiguous float32 matrix instead of N lists of boxed Python
+          floats — roughly half the memory and far better cache behavior
+        - Set-based deduplication (one ANY() lookup, not N point reads)
+        - COPY-based ingest instead of per-row INSERT round-trips
         - Error isolation
         """
         stats = {'processed': 0, 'created': 0, 'skipped': 0, 'failed': 0}
-        
+
+        if not contents:
+            return stats
+
         try:
-            # Process in batches
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                
-                logger.info("Processing batch", 
-                          batch_start=i, 
-                          batch_size=len(batch),
-                          total=len(documents))
-                
-                for document, doc_type, doc_id in batch:
+            # Hash everything up front so deduplication is one query.
+            # BLAKE3 releases the GIL, so large batches hash in parallel
+            if BLAKE3_AVAILABLE and len(contents) > 64:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    hashes = list(executor.map(_content_hash, contents))
+            else:
+                hashes = [_content_hash(content) for content in contents]
+
+            with self._conn() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT document_hash FROM document_embeddings "
+                        "WHERE document_hash = ANY(%s)",
+                        (hashes,)
+                    )
+                    existing = {row[0] for row in cur.fetchall()}
+
+                # Indices of the misses; the columns are never reshaped,
+                # just indexed
+                missing = []
+                seen = set(existing)
+                for i, content_hash in enumerate(hashes):
                     stats['processed'] += 1
-                    
+
+                    if content_hash in seen:
+                        stats['skipped'] += 1
+                        continue
+                    seen.add(content_hash)
+                    missing.append(i)
+
+                if missing:
+                    # Embed the misses with list-input API calls, then
+                    # keep the result as one (N, dim) float32 matrix
                     try:
-                        if self.create_embedding_record(document, doc_type, doc_id):
-                            stats['created'] += 1
-                        else:
-                            stats['skipped'] += 1
+                        embeddings = self.embedding_generator.embed_documents(
+                            [contents[i] for i in missing]
+                        )
                     except Exception as e:
-                        logger.warning("Failed to process document", 
-                                     error=str(e), 
-                                     doc_type=doc_type, 
-                                     doc_id=doc_id)
-                        stats['failed'] += 1
-                
-                # Small delay between batches to avoid overwhelming the database
-                import time
-                time.sleep(0.1)
-            
+                        logger.error("Batch embedding generation failed",
+                                    error=str(e),
+                                    document_count=len(missing))
+                        stats['failed'] = len(missing)
+                        return stats
+
+                    matrix = np.asarray(embeddings, dtype=np.float32)
+                    dimension = matrix.shape[1]
+
+                    rows = []
+                    for i, embedding in zip(missing, matrix):
+                        metadata = dict(metadatas[i])
+                        metadata.update({
+                            'source': 'python_langchain',
+                            'created_by': 'pgvector_store_manager',
+                            'content_length': len(contents[i])
+                        })
+
+                        rows.append((
+                            doc_types[i], doc_ids[i], hashes[i],
+                            contents[i], metadata,
+                            config.OPENAI_EMBEDDING_MODEL,
+                            dimension, embedding
+                        ))
+
+                    self._bulk_copy(conn, rows)
+                    conn.commit()
+                    stats['created'] = len(rows)
+
             logger.info("Bulk embedding creation completed", **stats)
             return stats
-            
+
         except Exception as e:
             logger.error("Bulk embedding creation failed", error=str(e))
             return stats
 
+    async def abulk_create_embeddings(self, documents: List[Tuple[Document, str, int]],
+                                      batch_size: int = 256,
+                                      concurrency: int = 8) -> Dict[str, int]:
+        """
+        Async bulk embedding ingest via asyncpg
+
+        Educational Focus:
+        - Overlapping I/O: embedding API sub-batches run concurrently
+          (blocking SDK calls pushed to threads) while asyncpg's native
+          copy_records_to_table streams the results in
+        - Throughput ends up bounded by embedding API concurrency, not
+          database round-trips
+
+        Args:
+            documents: (document, document_type, document_id) tuples
+            batch_size: Texts per embedding API call
+            concurrency: Maximum concurrent embedding calls
+        """
+        stats = {'processed': 0, 'created': 0, 'skipped': 0, 'failed': 0}
+
+        if not ASYNCPG_AVAILABLE:
+            raise ImportError("asyncpg is required for abulk_create_embeddings; "
+                              "use bulk_create_embeddings instead")
+        if not documents:
+            return stats
+
+        contents = [document.page_content for document, _, _ in documents]
+        hashes = [_content_hash(content) for content in contents]
+
+        pool = await asyncpg.create_pool(self._dsn, min_size=2, max_size=8)
+        try:
+            async with pool.acquire() as conn:
+                try:
+                    from pgvector.asyncpg import register_vector as aregister_vector
+                    await aregister_vector(conn)
+                except ImportError:
+                    pass
+
+                existing_rows = await conn.fetch(
+                    "SELECT document_hash FROM document_embeddings "
+                    "WHERE document_hash = ANY($1::text[])",
+                    hashes
+                )
+                seen = {row['document_hash'] for row in existing_rows}
+
+                missing = []
+                for (document, doc_type, doc_id), content_hash in zip(documents, hashes):
+                    stats['processed'] += 1
+                    if content_hash in seen:
+                        stats['skipped'] += 1
+                        continue
+                    seen.add(content_hash)
+                    missing.append((document, doc_type, doc_id, content_hash))
+
+                if not missing:
+                    return stats
+
+                # Embed sub-batches concurrently; the blocking SDK call
+                # runs in worker threads so gather actually overlaps
+                semaphore = asyncio.Semaphore(concurrency)
+
+                async def _embed(texts: List[str]) -> List[List[float]]:
+                    async with semaphore:
+                        return await asyncio.to_thread(
+                            self.embedding_generator.embed_documents, texts
+                        )
+
+                text_batches = [
+                    [document.page_content for document, _, _, _ in missing[i:i + batch_size]]
+                    for i in range(0, len(missing), batch_size)
+                ]
+
+                try:
+                    embedded_batches = await asyncio.gather(
+                        *[_embed(texts) for texts in text_batches]
+                    )
+                except Exception as e:
+                    logger.error("Async batch embedding failed",
+                                error=str(e),
+                                document_count=len(missing))
+                    stats['failed'] = len(missing)
+                    return stats
+
+                embeddings = [vec for batch in embedded_batches for vec in batch]
+
+                now = datetime.now()
+                records = []
+                for (document, doc_type, doc_id, content_hash), embedding in zip(missing, embeddings):
+                    metadata = document.metadata.copy() if document.metadata else {}
+                    metadata.update({
+                        'source': 'python_langchain',
+                        'created_by': 'pgvector_store_manager',
+                        'content_length': len(document.page_content)
+                    })
+                    records.append((
+                        doc_type, doc_id, content_hash,
+                        document.page_content,
+                        _json_dumps_bytes(metadata).decode('utf-8'),
+                        config.OPENAI_EMBEDDING_MODEL, len(embedding),
+                        np.asarray(embedding, dtype=np.float32),
+                        now, now
+                    ))
+
+                await conn.copy_records_to_table(
+                    'document_embeddings',
+                    records=records,
+                    columns=['document_type', 'document_id', 'document_hash',
+                             'content', 'metadata', 'embedding_model',
+                             'embedding_dimension', 'embedding',
+                             'created_at', 'updated_at']
+                )
+                stats['created'] = len(records)
+
+            logger.info("Async bulk embedding creation completed", **stats)
+            return stats
+        finally:
+            await pool.close()
+
+    # Document types that get their own partial ANN index; keep in sync
+    # with the types written by sync jobs
+    _KNOWN_DOCUMENT_TYPES = ('complaint',)
+
+    def ensure_indexes(self) -> bool:
+        """
+        Create the ANN and dedupe indexes if they do not exist
+
+        Educational Focus:
+        - Partial HNSW indexes: searches always filter by
+          document_type, so one graph per type turns every query into
+          a clean ANN scan over a smaller index instead of a global
+          scan plus post-filter
+        - The dedupe lookup rides the unique document_hash constraint
+          from the Laravel migration; a plain b-tree is built only on
+          databases that predate it
+        """
+        try:
+            with self._conn() as conn:
+                with conn.cursor() as cur:
+                    for doc_type in self._KNOWN_DOCUMENT_TYPES:
+                        cur.execute(f"""
+                            CREATE INDEX IF NOT EXISTS document_embeddings_hnsw_{doc_type}
+                            ON document_embeddings USING hnsw (embedding vector_cosine_ops)
+                            WITH (m = 16, ef_construction = 64)
+                            WHERE document_type = '{doc_type}'
+                        """)
+
+                    # The unique constraint already maintains a b-tree
+                    # over document_hash; duplicating it would cost
+                    # every write twice
+                    cur.execute("""
+                        SELECT 1 FROM pg_indexes
+                        WHERE tablename = 'document_embeddings'
+                          AND indexname = 'doc_embeddings_hash_unique'
+                    """)
+                    if cur.fetchone() is None:
+                        cur.execute("""
+                            CREATE INDEX IF NOT EXISTS document_embeddings_hash_idx
+                            ON document_embeddings (document_hash)
+                        """)
+
+                conn.commit()
+
+            logger.info("Vector store indexes ensured",
+                       document_types=list(self._KNOWN_DOCUMENT_TYPES))
+            return True
+
+        except Exception as e:
+            logger.error("Failed to ensure indexes", error=str(e))
+            return False
+
+    def _drop_ann_indexes(self) -> None:
+        """Drop the partial ANN indexes ahead of a large bulk load"""
+        with self._conn() as conn:
+            with conn.cursor() as cur:
+                for doc_type in self._KNOWN_DOCUMENT_TYPES:
+                    cur.execute(
+                        f"DROP INDEX IF EXISTS document_embeddings_hnsw_{doc_type}"
+                    )
+            conn.commit()
+
     def get_langchain_vector_store(self) -> Optional[PGVector]:
         """
         Get LangChain PGVector instance for RAG chains
@@ -323,17 +829,8 @@ class PGVectorStoreManager:
             
         try:
             if not self.vector_store:
-                # Build connection string for LangChain PGVector
-                connection_string = (
-                    f"postgresql://{self.connection_params['user']}:"
-                    f"{self.connection_params['password']}@"
-                    f"{self.connection_params['host']}:"
-                    f"{self.connection_params['port']}/"
-                    f"{self.connection_params['database']}"
-                )
-                
                 self.vector_store = PGVector(
-                    connection_string=connection_string,
+                    connection_string=self._dsn,
                     embedding_function=self.embedding_generator.embeddings,
                     collection_name="document_embeddings",
                     distance_strategy="cosine"
@@ -347,135 +844,184 @@ class PGVectorStoreManager:
             logger.error("Failed to initialize LangChain PGVector", error=str(e))
             return None
 
-    def sync_with_laravel_data(self) -> Dict[str, Any]:
+    _SYNC_QUERY = """
+        SELECT c.id,
+               concat_ws(E'\\n',
+                   'COMPLAINT TYPE: ' || c.complaint_type,
+                   'DESCRIPTION: ' || c.descriptor,
+                   'LOCATION: ' || c.borough || ', ' || c.incident_address,
+                   'AGENCY: ' || c.agency_name,
+                   'STATUS: ' || c.status,
+                   CASE WHEN a.summary IS NOT NULL
+                        THEN 'AI SUMMARY: ' || a.summary END,
+                   CASE WHEN a.category IS NOT NULL
+                        THEN 'CATEGORY: ' || a.category END
+               ) AS content,
+               json_build_object(
+                   'complaint_id', c.id,
+                   'borough', c.borough,
+                   'complaint_type', c.complaint_type,
+                   'agency', c.agency_name,
+                   'status', c.status,
+                   'submitted_at', c.submitted_at,
+                   'has_analysis', a.summary IS NOT NULL
+               ) AS metadata
+        FROM complaints c
+        LEFT JOIN complaint_analyses a ON c.id = a.complaint_id
+        WHERE NOT EXISTS (
+            SELECT 1 FROM document_embeddings de
+            WHERE de.document_type = 'complaint'
+              AND de.document_id = c.id
+        )
+        ORDER BY c.id
+    """
+
+    def sync_with_laravel_data(self, batch_size: int = 500) -> Dict[str, Any]:
         """
         Synchronize vector store with Laravel complaint data
-        
+
         Educational Focus:
         - Cross-platform data synchronization
-        - ETL patterns for vector data
+        - Producer/consumer pipeline: a reader thread streams rows off
+          a server-side cursor into a bounded queue while the main
+          thread embeds and COPYs, so DB reads overlap embedding I/O
+          and backpressure comes from the queue, not arbitrary sleeps
         - Progress tracking and reporting
         """
+        stats = {
+            'complaints_processed': 0,
+            'embeddings_created': 0,
+            'embeddings_skipped': 0,
+            'errors': 0
+        }
+
+        batches: "queue.Queue" = queue.Queue(maxsize=4)
+
+        def _read_batches():
+            """Stream unembedded complaints into the bounded queue"""
+            try:
+                with self._conn() as conn:
+                    with conn.cursor('sync_laravel_data',
+                                     cursor_factory=RealDictCursor) as cur:
+                        cur.itersize = 2000
+                        cur.execute(self._SYNC_QUERY)
+
+                        batch = []
+                        for row in cur:
+                            batch.append(row)
+                            if len(batch) >= batch_size:
+                                batches.put(batch)
+                                batch = []
+                        if batch:
+                            batches.put(batch)
+            except Exception as e:
+                logger.error("Sync reader failed", error=str(e))
+                batches.put(e)
+            finally:
+                batches.put(None)
+
         try:
-            stats = {
-                'complaints_processed': 0,
-                'embeddings_created': 0,
-                'embeddings_skipped': 0,
-                'errors': 0
-            }
-            
-            conn = psycopg2.connect(**self.connection_params)
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Get complaints that don't have embeddings yet
-                cur.execute("""
-                    SELECT c.id, c.complaint_type, c.descriptor, c.borough, 
-                           c.incident_address, c.agency_name, c.status,
-                           c.submitted_at, a.summary, a.category, a.tags
-                    FROM complaints c
-                    LEFT JOIN complaint_analyses a ON c.id = a.complaint_id
-                    LEFT JOIN document_embeddings de ON (
-                        de.document_type = 'complaint' AND de.document_id = c.id
-                    )
-                    WHERE de.id IS NULL
-                    ORDER BY c.id
-                    LIMIT 1000
-                """)
-                
-                complaints = cur.fetchall()
-                
-                logger.info("Found complaints without embeddings", count=len(complaints))
-                
-                # Process each complaint
-                documents = []
-                for complaint in complaints:
-                    stats['complaints_processed'] += 1
-                    
-                    # Format complaint content for embedding
-                    content_parts = [
-                        f"COMPLAINT TYPE: {complaint['complaint_type']}",
-                        f"DESCRIPTION: {complaint['descriptor']}",
-                        f"LOCATION: {complaint['borough']}, {complaint['incident_address']}",
-                        f"AGENCY: {complaint['agency_name']}",
-                        f"STATUS: {complaint['status']}",
-                    ]
-                    
-                    if complaint['summary']:
-                        content_parts.append(f"AI SUMMARY: {complaint['summary']}")
-                    
-                    if complaint['category']:
-                        content_parts.append(f"CATEGORY: {complaint['category']}")
-                    
-                    content = "\n".join(content_parts)
-                    
-                    # Create document with metadata
-                    metadata = {
-                        'complaint_id': complaint['id'],
-                        'borough': complaint['borough'],
-                        'complaint_type': complaint['complaint_type'],
-                        'agency': complaint['agency_name'],
-                        'status': complaint['status'],
-                        'submitted_at': complaint['submitted_at'].isoformat() if complaint['submitted_at'] else None,
-                        'has_analysis': bool(complaint['summary'])
-                    }
-                    
-                    document = Document(page_content=content, metadata=metadata)
-                    documents.append((document, 'complaint', complaint['id']))
-                
-            conn.close()
-            
-            # Bulk create embeddings
-            if documents:
-                bulk_stats = self.bulk_create_embeddings(documents)
-                stats.update({
-                    'embeddings_created': bulk_stats['created'],
-                    'embeddings_skipped': bulk_stats['skipped'],
-                    'errors': bulk_stats['failed']
-                })
-            
+            reader = threading.Thread(target=_read_batches,
+                                      name='sync-db-reader', daemon=True)
+            reader.start()
+
+            # Rebuilding the HNSW graph once after a large load beats
+            # growing it row by row; decide from the first batch size
+            indexes_dropped = False
+
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    stats['errors'] += 1
+                    continue
+
+                if not indexes_dropped and len(batch) >= batch_size:
+                    self._drop_ann_indexes()
+                    indexes_dropped = True
+
+                # Feed the columnar ingest path directly; no need to
+                # box each row into a Document on the way through
+                contents = [row['content'] for row in batch]
+                doc_ids = [row['id'] for row in batch]
+                metadatas = [row['metadata'] for row in batch]
+                stats['complaints_processed'] += len(batch)
+
+                bulk_stats = self._bulk_create_columnar(
+                    contents, ['complaint'] * len(batch), doc_ids, metadatas
+                )
+                stats['embeddings_created'] += bulk_stats['created']
+                stats['embeddings_skipped'] += bulk_stats['skipped']
+                stats['errors'] += bulk_stats['failed']
+
+            reader.join()
+
+            if indexes_dropped:
+                self.ensure_indexes()
+
             logger.info("Laravel data sync completed", **stats)
             return stats
-            
+
         except Exception as e:
             logger.error("Laravel data sync failed", error=str(e))
             return {'error': str(e)}
 
+    # Stats are typically polled by a dashboard; a short TTL keeps
+    # repeated calls off the database without serving stale numbers
+    _STATS_TTL_SECONDS = 30.0
+
     def get_statistics(self) -> Dict[str, Any]:
-        """Get vector store statistics"""
+        """
+        Get vector store statistics
+
+        Totals and both breakdowns come back in a single CTE query —
+        one round-trip instead of three — and the result is cached for
+        a short TTL.
+        """
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cached_at < self._STATS_TTL_SECONDS:
+            return self._stats_cache
+
         try:
-            conn = psycopg2.connect(**self.connection_params)
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Get basic statistics
+            with self._conn() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute("""
-                    SELECT 
-                        COUNT(*) as total_embeddings,
-                        COUNT(DISTINCT document_type) as document_types,
-                        COUNT(DISTINCT embedding_model) as embedding_models,
-                        AVG(embedding_dimension) as avg_dimension
-                    FROM document_embeddings
+                    WITH totals AS (
+                        SELECT
+                            COUNT(*) as total_embeddings,
+                            COUNT(DISTINCT document_type) as document_types,
+                            COUNT(DISTINCT embedding_model) as embedding_models,
+                            AVG(embedding_dimension) as avg_dimension
+                        FROM document_embeddings
+                    ),
+                    by_type AS (
+                        SELECT jsonb_object_agg(document_type, count) as breakdown
+                        FROM (
+                            SELECT document_type, COUNT(*) as count
+                            FROM document_embeddings
+                            GROUP BY document_type
+                        ) t
+                    ),
+                    by_model AS (
+                        SELECT jsonb_object_agg(embedding_model, count) as breakdown
+                        FROM (
+                            SELECT embedding_model, COUNT(*) as count
+                            FROM document_embeddings
+                            GROUP BY embedding_model
+                        ) m
+                    )
+                    SELECT
+                        totals.*,
+                        (SELECT breakdown FROM by_type) as type_breakdown,
+                        (SELECT breakdown FROM by_model) as model_breakdown
+                    FROM totals
                 """)
                 stats = cur.fetchone()
-                
-                # Get breakdown by document type
-                cur.execute("""
-                    SELECT document_type, COUNT(*) as count
-                    FROM document_embeddings
-                    GROUP BY document_type
-                    ORDER BY count DESC
-                """)
-                type_breakdown = {row['document_type']: row['count'] for row in cur.fetchall()}
-                
-                # Get breakdown by embedding model
-                cur.execute("""
-                    SELECT embedding_model, COUNT(*) as count
-                    FROM document_embeddings
-                    GROUP BY embedding_model
-                    ORDER BY count DESC
-                """)
-                model_breakdown = {row['embedding_model']: row['count'] for row in cur.fetchall()}
-                
-            conn.close()
-            
-            return {
+
+            type_breakdown = stats['type_breakdown'] or {}
+            model_breakdown = stats['model_breakdown'] or {}
+
+            result = {
                 'total_embeddings': stats['total_embeddings'],
                 'document_types': stats['document_types'],
                 'embedding_models': stats['embedding_models'],
@@ -485,7 +1031,10 @@ class PGVectorStoreManager:
                 'pgvector_available': True,
                 'connection_healthy': True
             }
-            
+            self._stats_cache = result
+            self._stats_cached_at = now
+            return result
+
         except Exception as e:
             logger.error("Failed to get statistics", error=str(e))
             return {
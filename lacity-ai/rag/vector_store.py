@@ -9,8 +9,10 @@ Educational Focus:
 - Production vector store management
 """
 
+import functools
 import os
 import pickle
+import shutil
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import numpy as np
@@ -23,6 +25,28 @@ except ImportError:
     FAISS_AVAILABLE = False
     faiss = None
 
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import msgpack
+    import zstandard
+    MSGPACK_ZSTD_AVAILABLE = True
+except ImportError:
+    MSGPACK_ZSTD_AVAILABLE = False
+
+from uuid import uuid4
+
+from langchain.docstore.in_memory import InMemoryDocstore
 from langchain.schema import Document
 from langchain.vectorstores import FAISS as LangChainFAISS
 
@@ -36,6 +60,83 @@ from rag.document_loader import ComplaintDocumentLoader
 
 logger = structlog.get_logger(__name__)
 
+def _filter_topk_py(scores: np.ndarray, indices: np.ndarray,
+                    threshold: float, limit: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep up-to-limit hits meeting the threshold, preserving order"""
+    mask = (scores >= threshold) & (indices >= 0)
+    return indices[mask][:limit], scores[mask][:limit]
+
+
+if NUMBA_AVAILABLE:
+    # Compiled scan over the raw FAISS output arrays; LLVM vectorizes
+    # the comparison loop, and cache=True amortizes compilation
+    @numba.njit(fastmath=True, cache=True)
+    def _filter_topk(scores, indices, threshold, limit):  # pragma: no cover
+        out_indices = np.empty(limit, dtype=np.int64)
+        out_scores = np.empty(limit, dtype=np.float32)
+        count = 0
+        for i in range(scores.shape[0]):
+            if scores[i] >= threshold and indices[i] >= 0:
+                out_indices[count] = indices[i]
+                out_scores[count] = scores[i]
+                count += 1
+                if count == limit:
+                    break
+        return out_indices[:count], out_scores[:count]
+else:
+    _filter_topk = _filter_topk_py
+
+
+# Below this corpus size a flat index is already fast and IVF-PQ
+# training has too few vectors to build useful codebooks
+_IVFPQ_MIN_DOCUMENTS = 4096
+
+# Mid-size corpora get 8-bit scalar quantization instead: 4x less
+# index memory and integer SIMD distance kernels, without needing
+# enough vectors to train PQ codebooks
+_SQ8_MIN_DOCUMENTS = 512
+
+# IVF training converges with a bounded sample; capping it keeps the
+# k-means pass from scaling with corpus size
+_IVF_TRAIN_SAMPLE = 65536
+
+# Low-cardinality metadata fields worth dictionary-encoding into
+# integer code columns for aggregation
+_CATEGORICAL_FIELDS = ('borough', 'agency', 'complaint_type')
+
+
+class DocColumns:
+    """
+    Columnar (structure-of-arrays) view of document metadata
+
+    Low-cardinality string fields are dictionary-encoded: each column
+    holds an int16 code array plus a small code->value table, so
+    aggregations like "distinct boroughs" reduce to np.unique over a
+    contiguous integer array instead of a Python loop over per-document
+    metadata dicts.
+    """
+
+    __slots__ = ('codes', 'values')
+
+    def __init__(self, documents: List[Document],
+                 fields: Tuple[str, ...] = _CATEGORICAL_FIELDS):
+        self.codes: Dict[str, np.ndarray] = {}
+        self.values: Dict[str, List[Any]] = {}
+        for field in fields:
+            table: Dict[Any, int] = {}
+            codes = np.empty(len(documents), dtype=np.int16)
+            for i, doc in enumerate(documents):
+                codes[i] = table.setdefault(doc.metadata.get(field),
+                                            len(table))
+            self.codes[field] = codes
+            self.values[field] = list(table)
+
+    def unique(self, field: str) -> set:
+        """Distinct non-empty values present in one column"""
+        values = self.values[field]
+        return {values[code] for code in np.unique(self.codes[field])} \
+            - {None, ''}
+
 
 class VectorStoreManager:
     """
@@ -70,6 +171,29 @@ class VectorStoreManager:
         self.vector_store_path = Path(vector_store_path or config.VECTOR_STORE_PATH)
         self.vector_store: Optional[LangChainFAISS] = None
         self.documents: List[Document] = []
+        # Contiguous L2-normalized float32 copy of all document
+        # embeddings; lets callers run a brute-force cosine scan when
+        # no ANN index is available
+        self.embedding_matrix: Optional[np.ndarray] = None
+        # int8-quantized companion matrix (per-dimension scale) for
+        # bandwidth-bound rerank/diversity cosine checks: 4x less
+        # memory traffic than float32 with negligible top-K recall loss
+        self.embedding_matrix_i8: Optional[np.ndarray] = None
+        self.embedding_scale: Optional[np.ndarray] = None
+        # HNSW graph over the same embeddings: sub-millisecond ANN
+        # lookups instead of an O(N*d) linear scan when FAISS is absent
+        self._hnsw = None
+        # Columnar metadata view for stats aggregation, built lazily;
+        # the version counter bumps on every document-set change and
+        # tells get_store_stats when the cached view is stale
+        self._columns: Optional[DocColumns] = None
+        self._version = 0
+        self._columns_version = -1
+        # Index memory vs flat float32 storage, set by _build_index;
+        # surfaces the recall/memory trade-off in get_store_stats
+        self._compression_ratio = 1.0
+        # JIT-compiled brute-force kernels memoized per (k, d) pair
+        self._search_kernels: Dict[Tuple[int, int], Any] = {}
         
         # Ensure vector store directory exists
         self.vector_store_path.parent.mkdir(parents=True, exist_ok=True)
@@ -77,6 +201,10 @@ class VectorStoreManager:
         # Check FAISS availability
         if not FAISS_AVAILABLE:
             logger.warning("FAISS not available, vector operations will be limited")
+        else:
+            # FAISS parallelizes across queries in a batch via OpenMP;
+            # give it every core so batched searches fan out
+            faiss.omp_set_num_threads(os.cpu_count() or 1)
         
         logger.info("VectorStoreManager initialized",
                    vector_store_path=str(self.vector_store_path),
@@ -91,10 +219,12 @@ class VectorStoreManager:
         - Vector store initialization
         - Batch processing for efficiency
         - Error handling in indexing
-        
+
         Args:
-            documents: List of LangChain Documents to index
-            
+            documents: List of LangChain Documents to index. The list
+                is aliased, not copied — the manager owns it after
+                this call and callers must not mutate it
+
         Returns:
             True if successful, False otherwise
         """
@@ -112,39 +242,74 @@ class VectorStoreManager:
         try:
             # Extract text content for embedding
             texts = [doc.page_content for doc in documents]
-            metadatas = [doc.metadata for doc in documents]
-            
-            # Create embeddings for all documents
+
+            # Create embeddings for all documents, writing each batch
+            # straight into a preallocated contiguous float32 matrix
+            # instead of growing a list of Python float lists
             logger.info("Generating embeddings for documents")
-            embeddings = []
-            
-            # Process in batches to manage memory
-            batch_size = config.EMBEDDING_BATCH_SIZE
-            for i in range(0, len(texts), batch_size):
-                batch_texts = texts[i:i + batch_size]
-                # Use the embedding generator's embeddings client directly for documents
-                batch_embeddings = self.embedding_generator.embeddings.embed_documents(batch_texts)
-                embeddings.extend(batch_embeddings)
-                
-                logger.debug("Processed embedding batch",
-                           batch_number=i // batch_size + 1,
-                           batch_size=len(batch_texts),
-                           total_processed=len(embeddings))
-            
-            # Create FAISS vector store
+            xb = self._embed_all(texts)
+
+            # Unit-normalize in place (C++ SIMD kernel) so that inner
+            # product equals cosine similarity; IP avoids the per-pair
+            # subtraction of the L2 distance kernel
+            faiss.normalize_L2(xb)
+
+            # Build the target index directly and add the matrix once.
+            # The previous path went through from_embeddings, which
+            # built a throwaway flat-L2 index that was immediately
+            # replaced — two full vector copies alive at peak
             logger.info("Creating FAISS vector store")
-            self.vector_store = LangChainFAISS.from_embeddings(
-                text_embeddings=list(zip(texts, embeddings)),
-                embedding=self.embedding_generator,
-                metadatas=metadatas
+            index = self._build_index(xb)
+
+            index_to_docstore_id = {}
+            docstore_entries = {}
+            for i, doc in enumerate(documents):
+                doc_id = str(uuid4())
+                index_to_docstore_id[i] = doc_id
+                docstore_entries[doc_id] = doc
+            self.vector_store = LangChainFAISS(
+                self.embedding_generator,
+                index,
+                InMemoryDocstore(docstore_entries),
+                index_to_docstore_id
             )
-            
-            # Store documents for reference
-            self.documents = documents.copy()
+
+            # Store documents for reference: alias the caller's list
+            # (see docstring) instead of copying N pointers, and bump
+            # the version so cached views rebuild lazily
+            self.documents = documents
+            self._version += 1
+
+            # xb is already unit-normalized, so it doubles as the
+            # matrix for brute-force cosine scans
+            self.embedding_matrix = xb
+
+            # Symmetric per-dimension quantization of the normalized rows
+            self.embedding_scale = 127.0 / np.maximum(
+                np.abs(self.embedding_matrix).max(axis=0), 1e-12
+            )
+            self.embedding_matrix_i8 = np.round(
+                self.embedding_matrix * self.embedding_scale
+            ).astype(np.int8)
+
+            # Row index lets consumers map a document back to its
+            # embedding without content hashing
+            for i, doc in enumerate(self.documents):
+                doc.metadata['_emb_row'] = i
+
+            # Build the HNSW graph over the normalized rows; graph
+            # traversal replaces the linear scan on the fallback path
+            if HNSWLIB_AVAILABLE:
+                dim = self.embedding_matrix.shape[1]
+                self._hnsw = hnswlib.Index(space='cosine', dim=dim)
+                self._hnsw.init_index(max_elements=len(self.documents),
+                                      ef_construction=200, M=16)
+                self._hnsw.add_items(self.embedding_matrix,
+                                     np.arange(len(self.documents)))
             
             logger.info("Vector store created successfully",
                        document_count=len(documents),
-                       embedding_dimension=len(embeddings[0]) if embeddings else 0)
+                       embedding_dimension=xb.shape[1])
             
             return True
             
@@ -154,7 +319,44 @@ class VectorStoreManager:
                         error=str(e))
             return False
     
-    def create_vector_store_from_complaints(self, 
+    def _embed_all(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed all texts into a preallocated float32 matrix
+
+        Batches run concurrently on a thread pool — each call blocks
+        on the embedding API round-trip, so overlapping the requests
+        scales wall time nearly linearly up to the provider's rate
+        limit (bounded by EMBEDDING_CONCURRENCY).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        xb = np.empty((len(texts), config.EMBEDDING_DIMENSION),
+                      dtype=np.float32)
+        batch_size = config.EMBEDDING_BATCH_SIZE
+        offsets = range(0, len(texts), batch_size)
+
+        def _embed_batch(offset: int) -> None:
+            batch_texts = texts[offset:offset + batch_size]
+            # Use the embedding generator's embeddings client directly
+            xb[offset:offset + batch_size] = \
+                self.embedding_generator.embeddings.embed_documents(batch_texts)
+
+            logger.debug("Processed embedding batch",
+                       batch_number=offset // batch_size + 1,
+                       batch_size=len(batch_texts))
+
+        max_workers = max(1, config.EMBEDDING_CONCURRENCY)
+        if len(texts) <= batch_size or max_workers == 1:
+            for offset in offsets:
+                _embed_batch(offset)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # list() propagates the first batch exception, if any
+                list(executor.map(_embed_batch, offsets))
+
+        return xb
+
+    def create_vector_store_from_complaints(self,
                                           complaint_data: List[Dict[str, Any]],
                                           chunk_documents: bool = True) -> bool:
         """
@@ -200,6 +402,73 @@ class VectorStoreManager:
                         error=str(e))
             return False
     
+    def _build_index(self, matrix: np.ndarray):
+        """
+        Build the FAISS index for a unit-normalized embedding matrix
+
+        Picks the index tier by corpus size and adds the vectors once,
+        directly into the final structure:
+
+        - Large corpora get IVF-PQ — queries probe a few Voronoi cells
+          over 8-bit product-quantized codes at roughly 1/8th the
+          float32 memory. Training runs on a capped sample so it stays
+          bounded as the corpus grows.
+        - Mid-size corpora get an 8-bit scalar quantizer: per-dimension
+          trained ranges, int8 codes, integer SIMD distance kernels.
+        - Everything else gets a flat inner-product scan.
+
+        All tiers use METRIC_INNER_PRODUCT (cosine over unit vectors);
+        a quantized tier that fails to build falls back to flat.
+        """
+        n, d = matrix.shape
+        try:
+            if n >= _IVFPQ_MIN_DOCUMENTS:
+                nlist = min(1024, max(64, int(4 * np.sqrt(n))))
+                # The OPQ pre-rotation redistributes variance across PQ
+                # subspaces, cutting quantization error at the same
+                # code size; the rotation is orthonormal, so inner
+                # products are preserved
+                index = faiss.index_factory(d, f"OPQ32,IVF{nlist},PQ32x8",
+                                            faiss.METRIC_INNER_PRODUCT)
+                train_sample = matrix[:_IVF_TRAIN_SAMPLE] \
+                    if n > _IVF_TRAIN_SAMPLE else matrix
+                index.train(train_sample)
+                index.add(matrix)
+                # The OPQ wrapper is an IndexPreTransform; setting
+                # nprobe on it would only attach a Python attribute to
+                # the SWIG proxy, leaving the inner IVF at its default
+                faiss.extract_index_ivf(index).nprobe = 16
+                # 32-byte PQ codes vs d float32 values per vector
+                self._compression_ratio = (d * 4) / 32.0
+
+                logger.info("OPQ+IVF-PQ index built",
+                           document_count=n,
+                           nlist=nlist,
+                           compression_ratio=self._compression_ratio)
+                return index
+
+            if n >= _SQ8_MIN_DOCUMENTS:
+                index = faiss.IndexScalarQuantizer(
+                    d, faiss.ScalarQuantizer.QT_8bit,
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                index.train(matrix)
+                index.add(matrix)
+                # int8 codes vs float32 values
+                self._compression_ratio = 4.0
+
+                logger.info("SQ8 index built", document_count=n)
+                return index
+        except Exception as e:
+            # Fall through to the flat index; correctness over speed
+            logger.warning("Quantized index build failed, using flat index",
+                          error=str(e))
+
+        index = faiss.IndexFlatIP(d)
+        index.add(matrix)
+        self._compression_ratio = 1.0
+        return index
+
     def add_documents_to_store(self, documents: List[Document]) -> bool:
         """
         Add new documents to existing vector store
@@ -231,6 +500,7 @@ class VectorStoreManager:
             
             # Update document collection
             self.documents.extend(documents)
+            self._version += 1
             
             logger.info("Documents added successfully",
                        total_documents=len(self.documents))
@@ -266,13 +536,15 @@ class VectorStoreManager:
         Returns:
             List of (document, score) tuples
         """
-        if not self.vector_store:
-            logger.warning("No vector store available for search")
-            return []
-        
         if not query or not query.strip():
             logger.warning("Empty query provided")
             return []
+
+        if not self.vector_store:
+            if self._hnsw is not None:
+                return self._hnsw_search(query.strip(), k, score_threshold, filters)
+            logger.warning("No vector store available for search")
+            return []
         
         logger.info("Searching for similar documents",
                    query_length=len(query),
@@ -281,24 +553,58 @@ class VectorStoreManager:
                    has_filters=filters is not None)
         
         try:
-            # Perform similarity search with scores
-            results = self.vector_store.similarity_search_with_score(
-                query=query.strip(),
-                k=k,
-                filter=filters
+            # Embed through the LRU cache and hit the FAISS index
+            # directly: the LangChain wrapper materializes a Document
+            # for every hit before thresholding and boxes the results
+            # in Python. The raw path thresholds and filters on numpy
+            # arrays first and builds tuples only for survivors
+            q = self._embed_query(query.strip()).reshape(1, -1) \
+                .astype(np.float32)
+            faiss.normalize_L2(q)
+
+            # Resolve metadata filters to a FAISS ID selector where
+            # possible so the index itself skips non-matching rows;
+            # otherwise overfetch and post-filter the candidates
+            fetch_k = k
+            params = self._selector_params(filters) if filters else None
+            if filters and params is None:
+                fetch_k = k * 4
+            if self.documents:
+                fetch_k = min(fetch_k, len(self.documents))
+
+            if params is not None:
+                scores, indices = self.vector_store.index.search(
+                    q, fetch_k, params=params
+                )
+            else:
+                scores, indices = self.vector_store.index.search(q, fetch_k)
+
+            top_indices, top_scores = _filter_topk(
+                np.ascontiguousarray(scores[0], dtype=np.float32),
+                np.ascontiguousarray(indices[0], dtype=np.int64),
+                np.float32(score_threshold), fetch_k
             )
-            
-            # Filter by score threshold
+
+            # Post-filter path: vectorized over the dictionary-encoded
+            # columns (np.isin over int16 codes) instead of
+            # per-document dict gets
+            if filters is not None and params is None and len(top_indices):
+                mask = self._filter_mask(top_indices, filters)
+                top_indices = top_indices[mask]
+                top_scores = top_scores[mask]
+
+            doc_count = len(self.documents)
             filtered_results = [
-                (doc, score) for doc, score in results 
-                if score >= score_threshold
+                (self.documents[idx], float(score))
+                for idx, score in zip(top_indices[:k], top_scores[:k])
+                if idx < doc_count
             ]
-            
+
             logger.info("Similar documents found",
-                       total_results=len(results),
+                       total_results=int(len(top_indices)),
                        filtered_results=len(filtered_results),
-                       best_score=max([score for _, score in filtered_results]) if filtered_results else 0)
-            
+                       best_score=float(top_scores[0]) if len(top_scores) else 0)
+
             return filtered_results
             
         except Exception as e:
@@ -307,6 +613,133 @@ class VectorStoreManager:
                         error=str(e))
             return []
     
+    def _ensure_columns(self) -> None:
+        """Rebuild the columnar metadata view if the corpus changed"""
+        if self._columns is None or self._columns_version != self._version:
+            self._columns = DocColumns(self.documents)
+            self._columns_version = self._version
+
+    def _selector_params(self, filters: Dict[str, Any]):
+        """
+        Build FAISS search parameters restricting search to matching rows
+
+        The filter dict resolves to a boolean mask over the
+        dictionary-encoded columns; the matching row ids feed an
+        IDSelectorBatch so the index never scores excluded vectors —
+        no Python callback per candidate. Returns None when a filter
+        key is not dictionary-encoded (callers post-filter instead).
+        """
+        try:
+            self._ensure_columns()
+            mask = np.ones(len(self.documents), dtype=bool)
+            for key, value in filters.items():
+                if key not in self._columns.codes:
+                    return None
+                wanted = [code for code, v in enumerate(self._columns.values[key])
+                          if v == value]
+                mask &= np.isin(self._columns.codes[key], wanted)
+
+            sel = faiss.IDSelectorBatch(np.flatnonzero(mask).astype(np.int64))
+            # Unwrap any pre-transform to reach the real IVF index;
+            # extract_index_ivf raises when there is none
+            try:
+                ivf = faiss.extract_index_ivf(self.vector_store.index)
+            except RuntimeError:
+                ivf = None
+            if ivf is not None:
+                return faiss.SearchParametersIVF(sel=sel, nprobe=ivf.nprobe)
+            return faiss.SearchParameters(sel=sel)
+        except Exception as e:
+            logger.debug("ID selector build failed, post-filtering",
+                        error=str(e))
+            return None
+
+    def _filter_mask(self,
+                     indices: np.ndarray,
+                     filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Vectorized metadata filter over candidate row indices
+
+        Categorical fields resolve each wanted value to its dictionary
+        code once, then np.isin runs over the int16 code column — no
+        per-document dict lookups. Non-categorical keys fall back to a
+        Python equality check.
+        """
+        self._ensure_columns()
+        mask = np.ones(len(indices), dtype=bool)
+        for key, value in filters.items():
+            if key in self._columns.codes:
+                wanted = [code for code, v in enumerate(self._columns.values[key])
+                          if v == value]
+                mask &= np.isin(self._columns.codes[key][indices], wanted)
+            else:
+                mask &= np.fromiter(
+                    (self.documents[idx].metadata.get(key) == value
+                     for idx in indices),
+                    dtype=bool, count=len(indices)
+                )
+        return mask
+
+    @functools.lru_cache(maxsize=4096)
+    def _embed_query(self, text: str) -> np.ndarray:
+        """
+        Embed a query string through a bounded LRU cache
+
+        Each embedding call is an API round-trip; query workloads
+        repeat heavily, so cache hits skip the network entirely. The
+        key is the query string itself — callers strip/normalize
+        before lookup.
+        """
+        return np.asarray(
+            self.embedding_generator.embed_user_question(text),
+            dtype=np.float32
+        )
+
+    def _hnsw_search(self,
+                     query: str,
+                     k: int,
+                     score_threshold: float,
+                     filters: Optional[Dict[str, Any]]) -> List[Tuple[Document, float]]:
+        """
+        ANN search over the hnswlib graph
+
+        Serves queries when no LangChain FAISS store is loaded but
+        embeddings exist. Metadata filters are applied to the returned
+        candidates, so fetch extra neighbours when filtering.
+        """
+        try:
+            query_vec = self._embed_query(query)
+
+            fetch_k = k * 4 if filters else k
+            fetch_k = min(fetch_k, len(self.documents))
+            labels, distances = self._hnsw.knn_query(query_vec, k=fetch_k)
+
+            results = []
+            for idx, distance in zip(labels[0], distances[0]):
+                similarity = 1.0 - float(distance)
+                if similarity < score_threshold:
+                    continue
+
+                doc = self.documents[idx]
+                if filters and any(doc.metadata.get(key) != value
+                                   for key, value in filters.items()):
+                    continue
+
+                results.append((doc, similarity))
+                if len(results) >= k:
+                    break
+
+            logger.debug("HNSW search completed",
+                        results_found=len(results))
+
+            return results
+
+        except Exception as e:
+            logger.error("HNSW search failed",
+                        query=query[:100],
+                        error=str(e))
+            return []
+
     def search_by_embedding(self,
                           embedding: List[float],
                           k: int = 5,
@@ -319,30 +752,61 @@ class VectorStoreManager:
         - Performance optimization
         - Use cases for pre-computed embeddings
         """
+        if embedding is None or len(embedding) == 0:
+            logger.warning("Empty embedding provided")
+            return []
+
         if not self.vector_store:
+            if self.embedding_matrix is not None:
+                return self._kernel_search(embedding, k, score_threshold)
             logger.warning("No vector store available for embedding search")
             return []
         
-        if not embedding:
-            logger.warning("Empty embedding provided")
-            return []
-        
         logger.debug("Searching by embedding",
                     embedding_dimension=len(embedding),
                     k=k)
         
         try:
-            # Convert to numpy array for FAISS
-            query_embedding = np.array([embedding], dtype=np.float32)
-            
-            # Perform search
-            scores, indices = self.vector_store.index.search(query_embedding, k)
-            
-            # Convert results to documents
-            results = []
-            for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
-                if score >= score_threshold and idx < len(self.documents):
-                    results.append((self.documents[idx], float(score)))
+            # Borrow ndarray inputs instead of re-converting: a float32
+            # vector reshapes to (1, d) as a view, no element-by-element
+            # list conversion
+            if isinstance(embedding, np.ndarray) \
+                    and embedding.dtype == np.float32:
+                query_embedding = embedding.reshape(1, -1) \
+                    if embedding.ndim == 1 else embedding
+                if not query_embedding.flags['C_CONTIGUOUS']:
+                    query_embedding = np.ascontiguousarray(query_embedding)
+            else:
+                query_embedding = np.asarray(
+                    embedding, dtype=np.float32
+                ).reshape(1, -1)
+
+            # Unit-normalize so the inner product against the index
+            # rows is cosine; already-unit vectors (the common case —
+            # embeddings arrive normalized) skip the copy entirely
+            norm = float(np.linalg.norm(query_embedding))
+            if abs(norm - 1.0) > 1e-3:
+                query_embedding = query_embedding / max(norm, 1e-12)
+
+            # Scores are cosine similarities (higher is better),
+            # matching the threshold compare inside _filter_topk;
+            # route through the batched API with B=1
+            scores, indices = self.search_by_embeddings(query_embedding, k)
+
+            # Filter on the raw arrays in one compiled pass, then
+            # materialize Documents only for the survivors
+            top_indices, top_scores = _filter_topk(
+                np.ascontiguousarray(scores[0], dtype=np.float32),
+                np.ascontiguousarray(indices[0], dtype=np.int64),
+                np.float32(score_threshold), k
+            )
+
+            doc_count = len(self.documents)
+            results = [
+                (self.documents[idx], float(score))
+                for idx, score in zip(top_indices, top_scores)
+                if idx < doc_count
+            ]
             
             logger.debug("Embedding search completed",
                         results_found=len(results))
@@ -355,6 +819,90 @@ class VectorStoreManager:
                         error=str(e))
             return []
     
+    def search_by_embeddings(self,
+                             embeddings: np.ndarray,
+                             k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Batched search over a (B, d) float32 query matrix
+
+        One index.search call fans the whole batch out over OpenMP
+        threads inside FAISS — far higher throughput than B separate
+        single-query calls. Returns the raw (scores, indices) arrays,
+        both shaped (B, k); callers materialize Documents themselves.
+        """
+        if embeddings.dtype != np.float32:
+            embeddings = embeddings.astype(np.float32)
+        return self.vector_store.index.search(embeddings, k)
+
+    def _topk_kernel(self, k: int, d: int):
+        """
+        Return a brute-force top-k scan specialized for one (k, d)
+
+        Production traffic uses a handful of (k, dimension) pairs, so
+        each pair gets its own JIT-compiled kernel with both values as
+        compile-time constants captured by closure — the inner product
+        loop unrolls over a fixed d and the insertion buffer has a
+        fixed length. Compiled kernels are memoized per pair. Without
+        Numba the fallback is a NumPy matvec + argpartition.
+        """
+        kernel = self._search_kernels.get((k, d))
+        if kernel is not None:
+            return kernel
+
+        if NUMBA_AVAILABLE:
+            @numba.njit(fastmath=True)
+            def kernel(xq, xb):  # pragma: no cover
+                best_scores = np.full(k, np.float32(-2.0), dtype=np.float32)
+                best_idx = np.full(k, -1, dtype=np.int64)
+                for i in range(xb.shape[0]):
+                    score = 0.0
+                    for j in range(d):
+                        score += xb[i, j] * xq[j]
+                    if score > best_scores[k - 1]:
+                        # Insertion into the fixed-size sorted buffer
+                        pos = k - 1
+                        while pos > 0 and best_scores[pos - 1] < score:
+                            best_scores[pos] = best_scores[pos - 1]
+                            best_idx[pos] = best_idx[pos - 1]
+                            pos -= 1
+                        best_scores[pos] = score
+                        best_idx[pos] = i
+                return best_idx, best_scores
+        else:
+            def kernel(xq, xb):
+                scores = xb @ xq
+                kk = min(k, scores.shape[0])
+                top = np.argpartition(scores, -kk)[-kk:]
+                top = top[np.argsort(scores[top])[::-1]]
+                return top.astype(np.int64), scores[top].astype(np.float32)
+
+        self._search_kernels[(k, d)] = kernel
+        return kernel
+
+    def _kernel_search(self,
+                       embedding: List[float],
+                       k: int,
+                       score_threshold: float) -> List[Tuple[Document, float]]:
+        """Brute-force cosine scan when no FAISS store is loaded"""
+        try:
+            xq = np.array(embedding, dtype=np.float32)
+            xq /= max(float(np.linalg.norm(xq)), 1e-12)
+
+            kernel = self._topk_kernel(min(k, len(self.documents)),
+                                       self.embedding_matrix.shape[1])
+            indices, scores = kernel(xq, self.embedding_matrix)
+
+            return [
+                (self.documents[idx], float(score))
+                for idx, score in zip(indices, scores)
+                if idx >= 0 and score >= score_threshold
+            ]
+        except Exception as e:
+            logger.error("Kernel search failed",
+                        embedding_dimension=len(embedding),
+                        error=str(e))
+            return []
+
     def save_vector_store(self, path: Optional[str] = None) -> bool:
         """
         Save vector store to disk
@@ -379,16 +927,34 @@ class VectorStoreManager:
             # Save the FAISS vector store
             self.vector_store.save_local(str(save_path))
             
-            # Save additional metadata
-            metadata_path = save_path.with_suffix('.metadata.pkl')
-            with open(metadata_path, 'wb') as f:
-                pickle.dump({
-                    'documents': self.documents,
-                    'document_count': len(self.documents),
-                    'embedding_dimension': config.EMBEDDING_DIMENSION,
-                    'model_name': config.OPENAI_EMBEDDING_MODEL
-                }, f)
-            
+            # Save additional metadata: msgpack + zstd when available
+            # (smaller files, faster serialization, no arbitrary code
+            # execution on load), pickle otherwise
+            payload = {
+                'documents': [(doc.page_content, doc.metadata)
+                              for doc in self.documents],
+                'document_count': len(self.documents),
+                'embedding_dimension': config.EMBEDDING_DIMENSION,
+                'model_name': config.OPENAI_EMBEDDING_MODEL,
+                'embedding_scale': (self.embedding_scale.tolist()
+                                    if self.embedding_scale is not None
+                                    else None)
+            }
+            if MSGPACK_ZSTD_AVAILABLE:
+                metadata_path = save_path.with_suffix('.metadata.msgpack.zst')
+                compressor = zstandard.ZstdCompressor(level=3)
+                with open(metadata_path, 'wb') as f:
+                    f.write(compressor.compress(
+                        msgpack.packb(payload, use_bin_type=True,
+                                      default=str)
+                    ))
+            else:
+                metadata_path = save_path.with_suffix('.metadata.pkl')
+                payload['documents'] = self.documents
+                payload['embedding_scale'] = self.embedding_scale
+                with open(metadata_path, 'wb') as f:
+                    pickle.dump(payload, f)
+
             logger.info("Vector store saved successfully",
                        path=str(save_path),
                        metadata_path=str(metadata_path))
@@ -421,23 +987,64 @@ class VectorStoreManager:
                    path=str(load_path))
         
         try:
-            # Load the FAISS vector store
-            self.vector_store = LangChainFAISS.load_local(
-                str(load_path),
-                self.embedding_generator
-            )
-            
-            # Load additional metadata if available
+            index_path = load_path / 'index.faiss'
+            pkl_path = load_path / 'index.pkl'
+            if FAISS_AVAILABLE and index_path.exists() and pkl_path.exists():
+                # Memory-map the index instead of deserializing a
+                # private heap copy: pages fault in on demand, so load
+                # time and resident memory stop scaling with index
+                # size, and concurrent processes share one page cache
+                index = faiss.read_index(
+                    str(index_path),
+                    faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+                with open(pkl_path, 'rb') as f:
+                    docstore, index_to_docstore_id = pickle.load(f)
+                self.vector_store = LangChainFAISS(
+                    self.embedding_generator,
+                    index,
+                    docstore,
+                    index_to_docstore_id
+                )
+            else:
+                # Fall back to the stock loader when the layout does
+                # not match (or FAISS itself is unavailable)
+                self.vector_store = LangChainFAISS.load_local(
+                    str(load_path),
+                    self.embedding_generator
+                )
+
+            # Load additional metadata if available, preferring the
+            # msgpack + zstd sidecar and falling back to legacy pickle
+            # files written by older versions
+            msgpack_path = load_path.with_suffix('.metadata.msgpack.zst')
             metadata_path = load_path.with_suffix('.metadata.pkl')
-            if metadata_path.exists():
+            metadata = None
+            if MSGPACK_ZSTD_AVAILABLE and msgpack_path.exists():
+                with open(msgpack_path, 'rb') as f:
+                    # Stream-decompress straight into the unpacker so
+                    # the intermediate plaintext never materializes
+                    reader = zstandard.ZstdDecompressor().stream_reader(f)
+                    metadata = msgpack.unpack(reader, raw=False)
+                self.documents = [
+                    Document(page_content=content, metadata=meta)
+                    for content, meta in metadata.get('documents', [])
+                ]
+                scale = metadata.get('embedding_scale')
+                self.embedding_scale = (np.asarray(scale, dtype=np.float32)
+                                        if scale is not None else None)
+            elif metadata_path.exists():
                 with open(metadata_path, 'rb') as f:
                     metadata = pickle.load(f)
-                    self.documents = metadata.get('documents', [])
-                    
-                    logger.debug("Loaded vector store metadata",
-                                document_count=metadata.get('document_count'),
-                                embedding_dimension=metadata.get('embedding_dimension'),
-                                model_name=metadata.get('model_name'))
+                self.documents = metadata.get('documents', [])
+                self.embedding_scale = metadata.get('embedding_scale')
+
+            if metadata is not None:
+                self._version += 1
+                logger.debug("Loaded vector store metadata",
+                            document_count=metadata.get('document_count'),
+                            embedding_dimension=metadata.get('embedding_dimension'),
+                            model_name=metadata.get('model_name'))
             
             logger.info("Vector store loaded successfully",
                        path=str(load_path),
@@ -467,24 +1074,19 @@ class VectorStoreManager:
         if hasattr(self.vector_store, 'index'):
             stats.update({
                 'index_size': self.vector_store.index.ntotal,
-                'index_dimension': self.vector_store.index.d
+                'index_dimension': self.vector_store.index.d,
+                'compression_ratio': self._compression_ratio
             })
         
-        # Analyze document metadata
+        # Analyze document metadata through the columnar view; the
+        # dictionary-encoded columns make each distinct-value pass an
+        # np.unique over int16 codes
         if self.documents:
-            boroughs = set()
-            agencies = set()
-            complaint_types = set()
-            
-            for doc in self.documents:
-                metadata = doc.metadata
-                if metadata.get('borough'):
-                    boroughs.add(metadata['borough'])
-                if metadata.get('agency'):
-                    agencies.add(metadata['agency'])
-                if metadata.get('complaint_type'):
-                    complaint_types.add(metadata['complaint_type'])
-            
+            self._ensure_columns()
+            boroughs = self._columns.unique('borough')
+            agencies = self._columns.unique('agency')
+            complaint_types = self._columns.unique('complaint_type')
+
             stats.update({
                 'unique_boroughs': len(boroughs),
                 'unique_agencies': len(agencies),
@@ -502,15 +1104,17 @@ class VectorStoreManager:
         
         try:
             if delete_path.exists():
-                # Delete FAISS files
-                for file_path in delete_path.glob('*'):
-                    file_path.unlink()
-                delete_path.rmdir()
-                
-                # Delete metadata file
-                metadata_path = delete_path.with_suffix('.metadata.pkl')
-                if metadata_path.exists():
-                    metadata_path.unlink()
+                # Delete the store directory in one C-implemented
+                # walk (handles subdirectories too) instead of a
+                # per-file Python unlink loop
+                shutil.rmtree(delete_path)
+
+
+                # Delete metadata sidecars (either format)
+                for suffix in ('.metadata.msgpack.zst', '.metadata.pkl'):
+                    metadata_path = delete_path.with_suffix(suffix)
+                    if metadata_path.exists():
+                        metadata_path.unlink()
                 
                 logger.info("Vector store deleted",
                            path=str(delete_path))
@@ -518,7 +1122,12 @@ class VectorStoreManager:
                 # Clear in-memory store
                 self.vector_store = None
                 self.documents = []
-                
+                self.embedding_matrix = None
+                self.embedding_matrix_i8 = None
+                self.embedding_scale = None
+                self._hnsw = None
+                self._version += 1
+
                 return True
         except Exception as e:
             logger.error("Failed to delete vector store",
@@ -540,5 +1149,11 @@ class VectorStoreManager:
         return self.create_vector_store_from_documents(self.documents)
 
 
-# Global vector store manager instance
-vector_store_manager = VectorStoreManager()
\ No newline at end of file
+# Lazy accessor for the shared manager: constructing it eagerly at
+# import instantiated the embedding generator and document loader and
+# created the store directory in every process that merely imported
+# this module
+@functools.cache
+def get_vector_store_manager() -> VectorStoreManager:
+    """Get the shared vector store manager (built on first use)"""
+    return VectorStoreManager()
\ No newline at end of file
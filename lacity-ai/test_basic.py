@@ -62,19 +62,22 @@ def test_langchain_runner_structure():
             print("❌ langchain_runner.py not found")
             return False
             
-        # Test basic argument parsing
-        import subprocess
-        result = subprocess.run([
-            sys.executable, str(runner_path), "--help"
-        ], capture_output=True, text=True, timeout=10)
-        
-        if result.returncode == 0:
-            print("✅ langchain_runner.py help command works")
-            print(f"Available operations: analyze_complaint, answer_question, chat, etc.")
-            return True
-        else:
-            print(f"❌ langchain_runner.py help failed: {result.stderr}")
+        # Build the argument parser in-process: no interpreter spawn,
+        # and import errors surface directly instead of hiding behind
+        # a subprocess return code
+        from langchain_runner import build_arg_parser
+        help_text = build_arg_parser().format_help()
+
+        expected_operations = ['analyze_complaint', 'answer_question',
+                               'chat', 'health_check']
+        missing = [op for op in expected_operations if op not in help_text]
+        if missing:
+            print(f"❌ Operations missing from CLI help: {missing}")
             return False
+
+        print("✅ langchain_runner.py argument parser works")
+        print(f"Available operations: {', '.join(expected_operations)}, etc.")
+        return True
             
     except Exception as e:
         print(f"❌ LangChain runner test failed: {str(e)}")